@@ -2,10 +2,16 @@
 
 import argparse
 import asyncio
+import functools
+import hashlib
+import io
 import os
+import re
 import shutil
 import subprocess
-from collections.abc import Coroutine
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from typing import cast, final, override
 
@@ -20,6 +26,16 @@ DEMONSTRATION_DIRECTORY: str = os.path.join(
 # The path to the VHS tapes directory
 VHS_TAPES_DIRECTORY: Path = Path(DEMONSTRATION_DIRECTORY, "vhs-tapes")
 
+# The path to the videos directory,
+# resolved before the script changes directory
+VIDEOS_DIRECTORY: Path = Path(PYTHON_SCRIPT_DIRECTORY, "videos").resolve()
+
+# The path to the directory caching the hashes of the VHS tapes,
+# resolved before the script changes directory
+VHS_CACHE_DIRECTORY: Path = Path(
+	PYTHON_SCRIPT_DIRECTORY, ".vhs-cache"
+).resolve()
+
 # The protected folder
 PROTECTED_FOLDER: str = "protected-folder"
 
@@ -55,8 +71,8 @@ KEYMAP_TOML_FILE_NAME: str = os.path.join(
 	PYTHON_SCRIPT_DIRECTORY, "../../", "keymap.toml"
 )
 
-# The set of archive file extensions
-ARCHIVE_FILE_EXTENSIONS: set[str] = {".zip", ".7z"}
+# The archive file extensions
+ARCHIVE_FILE_EXTENSIONS: tuple[str, ...] = (".zip", ".7z")
 
 # The plugin command template
 PLUGIN_COMMAND_TEMPLATE = "plugin augment-command.{}"
@@ -105,9 +121,151 @@ CHANGE_TO_WORKING_DIRECTORY: str = f'Type "cd {DEMONSTRATION_DIRECTORY}" Enter'
 # The command to clear the screen
 CLEAR_SCREEN: str = "Type 'clear' Enter"
 
+# The commands to start the set up section of a VHS tape
+SETUP_PREAMBLE: str = "\n".join(
+	[
+		"Hide",
+		FAST_TYPING_SPEED,
+		CHANGE_TO_WORKING_DIRECTORY,
+	]
+)
+
+# The commands to transition from the set up section to the demo
+SETUP_TO_DEMO_TRANSITION: str = "\n".join(
+	[
+		CLEAR_SCREEN,
+		NORMAL_TYPING_SPEED,
+		"Show",
+	]
+)
+
+# The commands to start the clean up section of a VHS tape
+CLEAN_UP_PREAMBLE: str = "\n".join(
+	[
+		"Hide",
+		FAST_TYPING_SPEED,
+	]
+)
+
+# The commands to quit yazi
+QUIT_YAZI_BLOCK: str = "\n".join(
+	[
+		SLEEP_TIME,
+		'Type "q"',
+		SHORT_SLEEP_TIME,
+	]
+)
+
+# The commands to toggle the selection between two items once,
+# with a trailing newline so the block can be repeated
+# with string multiplication
+TOGGLE_SELECTION_BLOCK: str = "\n".join(
+	[
+		"Ctrl+n",
+		VERY_SHORT_SLEEP_TIME,
+		"Ctrl+p",
+		VERY_SHORT_SLEEP_TIME,
+		"",
+	]
+)
+
+# The body to select a few items and hover an item in the empty folder
+SELECT_ITEMS_AND_ENTER_EMPTY_FOLDER_BODY: tuple[str, ...] = (
+	f'Type "/{FIRST_FILE_NAME}" Enter',
+	SLEEP_TIME,
+	'Type "j"',
+	"Space@300ms 3",
+	SLEEP_TIME,
+	f'Type "/{EMPTY_FOLDER}" Enter',
+	SLEEP_TIME,
+	'Type "l"',
+)
+
+# The body to open the hovered archive and leave it
+OPEN_HOVERED_ARCHIVE_BODY: tuple[str, ...] = (
+	'Type "/{0}" Enter',
+	SLEEP_TIME,
+	'Type "l"',
+	SLEEP_TIME,
+	'Type "h"',
+)
+
+# The body to paste the copied text into the filter input
+PASTE_COPIED_TEXT_BODY: tuple[str, ...] = (
+	'Type ":" Escape',
+	'Type "p"',
+	SLEEP_TIME,
+	"Ctrl+c",
+)
+
 # Whether to wait after cleaning up (for debugging purposes)
 WAIT_AFTER_CLEANING_UP: bool = True
 
+# The regular expression to match a Sleep command
+SLEEP_COMMAND_REGEX: re.Pattern[str] = re.compile(
+	r"Sleep (\d+(?:\.\d+)?)(s|ms)"
+)
+
+
+def format_sleep_command(duration_in_ms: float) -> str:
+	"Format the given duration in milliseconds as a Sleep command"
+
+	# If the duration is a whole number of seconds,
+	# format the duration in seconds
+	if duration_in_ms % 1000 == 0:
+		return f"Sleep {int(duration_in_ms) // 1000}s"
+
+	# Otherwise, format the duration in milliseconds
+	return f"Sleep {duration_in_ms:g}ms"
+
+
+def consolidate_sleep_commands(vhs_tape: str) -> str:
+	"""
+	Function to merge runs of consecutive Sleep commands
+	in the given VHS tape into a single Sleep command
+	so that vhs schedules one delay instead of several.
+	"""
+
+	# The list of consolidated lines
+	consolidated_lines: list[str] = []
+
+	# The duration of the current run of Sleep commands in milliseconds
+	sleep_duration_in_ms: float = 0
+
+	# Iterate over the lines of the VHS tape
+	for line in vhs_tape.split("\n"):
+		#
+
+		# Try to match the line against a Sleep command
+		sleep_match = SLEEP_COMMAND_REGEX.fullmatch(line)
+
+		# If the line is a Sleep command,
+		# add its duration to the current run and continue
+		if sleep_match:
+			duration, unit = sleep_match.groups()
+			sleep_duration_in_ms += float(duration) * (
+				1000 if unit == "s" else 1
+			)
+			continue
+
+		# Otherwise, if a run of Sleep commands has just ended,
+		# emit a single Sleep command for the whole run
+		if sleep_duration_in_ms:
+			consolidated_lines.append(
+				format_sleep_command(sleep_duration_in_ms)
+			)
+			sleep_duration_in_ms = 0
+
+		# Add the line to the consolidated lines
+		consolidated_lines.append(line)
+
+	# Emit the final run of Sleep commands if there is one
+	if sleep_duration_in_ms:
+		consolidated_lines.append(format_sleep_command(sleep_duration_in_ms))
+
+	# Return the consolidated VHS tape
+	return "\n".join(consolidated_lines)
+
 
 def create_apply_config_command(*, wait: bool = True) -> str:
 	"""
@@ -133,6 +291,11 @@ def get_command_line_arguments() -> argparse.Namespace:
 	the command line arguments and return the arguments.
 	"""
 
+	# If no arguments are given, which is the common case,
+	# skip building the argument parser entirely
+	if len(sys.argv) == 1:
+		return argparse.Namespace(search_term=None)
+
 	# Create the command line argument parser
 	parser: argparse.ArgumentParser = argparse.ArgumentParser()
 
@@ -152,29 +315,59 @@ def get_command_line_arguments() -> argparse.Namespace:
 	return args
 
 
+@functools.lru_cache(maxsize=None)
+def create_require_block(required_programs: frozenset[str]) -> str:
+	"""
+	Function to create the block of Require commands
+	for the given set of required programs.
+
+	The programs are sorted so that identical sets
+	produce identical blocks and hit the cache.
+	"""
+
+	# Create and return the block of Require commands
+	return "\n".join(
+		f'Require "{program}"' for program in sorted(required_programs)
+	)
+
+
+@functools.lru_cache(maxsize=None)
+def get_plugin_source_hash() -> str:
+	"""
+	Function to get the hash of the plugin's Lua source files.
+
+	The hash is cached so the Lua files are only read once per run,
+	before any of the demos mutate the plugin configuration.
+	"""
+
+	# Initialise the hash object
+	blake2b = hashlib.blake2b()
+
+	# Iterate over the plugin's Lua files in sorted order
+	# so the hash is deterministic
+	for lua_file in sorted(PYTHON_SCRIPT_DIRECTORY.glob("*.lua")):
+		#
+
+		# Add the contents of the Lua file to the hash
+		blake2b.update(lua_file.read_bytes())
+
+	# Return the hash of the plugin's Lua source files
+	return blake2b.hexdigest()
+
+
 @final
+@dataclass(frozen=True, slots=True, kw_only=True)
 class Script:
 	"A class to represent a script for a VHS tape"
 
-	__slots__ = ("setup", "clean_up", "required_programs")
+	# The setup commands for the script
+	setup: str = ""
 
-	def __init__(
-		self,
-		*,
-		setup: str | list[str] = "",
-		clean_up: str | list[str] = "",
-		required_programs: list[str] | None = None,
-	):
-		"Initialise the script for a VHS tape"
+	# The clean up commands for the script
+	clean_up: str = ""
 
-		# Save all the given variables
-		self.setup: str = setup if isinstance(setup, str) else "\n".join(setup)
-		self.clean_up: str = (
-			clean_up if isinstance(clean_up, str) else "\n".join(clean_up)
-		)
-		self.required_programs: list[str] = (
-			required_programs if required_programs is not None else []
-		)
+	# The programs required by the script
+	required_programs: tuple[str, ...] = ()
 
 
 @final
@@ -184,6 +377,7 @@ class VHSTape:
 	__slots__ = (
 		"name",
 		"file_name",
+		"_name_lower",
 		"files_and_directories",
 		"setup",
 		"clean_up",
@@ -192,6 +386,11 @@ class VHSTape:
 		"yazi_body",
 		"skip_quitting_yazi",
 		"editor",
+		"_cleanup_targets",
+		"_rm_command",
+		"_require_block",
+		"_clean_up_block",
+		"_rendered",
 	)
 
 	def __init__(
@@ -200,8 +399,8 @@ class VHSTape:
 		name: str,
 		files_and_directories: list[str] | None = None,
 		scripts: list[Script] | None = None,
-		shell_body: list[str] | None = None,
-		yazi_body: list[str],
+		shell_body: list[str] | tuple[str, ...] | None = None,
+		yazi_body: list[str] | tuple[str, ...],
 		skip_quitting_yazi: bool = False,
 		editor: str | None = None,
 	):
@@ -209,12 +408,21 @@ class VHSTape:
 
 		# Save all the given variables
 		self.name: str = name
-		self.file_name: str = name.lower().replace(" ", "-")
-		self.files_and_directories: list[str] = (
-			files_and_directories if files_and_directories is not None else []
+		self._name_lower: str = name.lower()
+		self.file_name: str = self._name_lower.replace(" ", "-")
+		self.files_and_directories: tuple[str, ...] = (
+			tuple(files_and_directories)
+			if files_and_directories is not None
+			else ()
+		)
+		self.shell_body: tuple[str, ...] = (
+			tuple(self._substitute(line) for line in shell_body)
+			if shell_body
+			else ()
+		)
+		self.yazi_body: tuple[str, ...] = tuple(
+			self._substitute(line) for line in yazi_body
 		)
-		self.shell_body: list[str] = shell_body if shell_body else []
-		self.yazi_body: list[str] = yazi_body
 		self.skip_quitting_yazi: bool = skip_quitting_yazi
 		self.editor: str | None = editor
 
@@ -222,10 +430,10 @@ class VHSTape:
 		scripts = scripts if scripts else []
 
 		# Initialise the setup scripts
-		self.setup: list[str] = []
+		setup: list[str] = []
 
 		# Initialise the clean up scripts
-		self.clean_up: list[str] = []
+		clean_up: list[str] = []
 
 		# Initialise the required programs
 		self.required_programs: set[str] = set()
@@ -235,14 +443,18 @@ class VHSTape:
 			#
 
 			# Add the setup script
-			self.setup.append(script.setup)
+			setup.append(self._substitute(script.setup))
 
 			# Add the clean up script
-			self.clean_up.append(script.clean_up)
+			clean_up.append(self._substitute(script.clean_up))
 
 			# Add the required programs
 			self.required_programs.update(script.required_programs)
 
+		# Save the setup and clean up scripts as tuples
+		self.setup: tuple[str, ...] = tuple(setup)
+		self.clean_up: tuple[str, ...] = tuple(clean_up)
+
 		# Add yazi and clear to the required programs
 		# as they are required for all demos
 		self.required_programs.update(
@@ -256,10 +468,6 @@ class VHSTape:
 		if self.editor:
 			self.required_programs.add(self.editor.strip().split()[0])
 
-	@override
-	def __str__(self) -> str:
-		"Return the VHS tape as a string"
-
 		# The files and directories to clean up
 		files_and_directories_to_clean_up: set[str] = set()
 
@@ -267,11 +475,14 @@ class VHSTape:
 		for item in self.files_and_directories:
 			#
 
+			# Get the item with the trailing slashes removed
+			stripped_item = item.strip("/")
+
 			# Add the item with the trailing slashes removed
-			files_and_directories_to_clean_up.add(item.strip("/"))
+			files_and_directories_to_clean_up.add(stripped_item)
 
 			# Get the file name and the file extension
-			file_name, file_extension = os.path.splitext(item)
+			file_name, file_extension = os.path.splitext(stripped_item)
 
 			# If the file extension is an archive file extension
 			if file_extension in ARCHIVE_FILE_EXTENSIONS:
@@ -280,95 +491,122 @@ class VHSTape:
 				# Add the item without the file extension
 				files_and_directories_to_clean_up.add(file_name)
 
-		# If the list of files and directories to clean up is not empty
-		if files_and_directories_to_clean_up:
+		# Save the files and directories to clean up
+		self._cleanup_targets: frozenset[str] = frozenset(
+			files_and_directories_to_clean_up
+		)
+
+		# Precompute the command to remove
+		# the files and directories to clean up
+		self._rm_command: str = (
+			f"Type 'rm -rf {' '.join(sorted(self._cleanup_targets))}' Enter"
+		)
+
+		# If there are files and directories to clean up
+		if self._cleanup_targets:
 			#
 
-			# Append the rm command to the required programs
+			# Add the rm command to the required programs
 			self.required_programs.add("rm")
 
-		# fmt: off
+		# The block of Require commands for the VHS tape
+		self._require_block: str = create_require_block(
+			frozenset(self.required_programs)
+		)
 
-		# The list of lines
-		lines: list[str] = [
+		# The clean up commands that are not empty
+		clean_up_commands = [command for command in self.clean_up if command]
 
-			# The output file for the VHS tape
-			f"Output ../videos/{self.file_name}.mp4",
+		# If there are files and directories to clean up,
+		# add the rm command to the clean up commands
+		if self._cleanup_targets:
+			clean_up_commands.append(self._rm_command)
 
-			# The required programs for the VHS tape
-			"\n".join(
-				[f'Require "{program}"' for program in self.required_programs]
-			),
+		# The clean up block for the VHS tape,
+		# which is None when there is nothing to clean up
+		self._clean_up_block: str | None = (
+			"\n".join([CLEAN_UP_PREAMBLE, *clean_up_commands])
+			if clean_up_commands
+			else None
+		)
+
+		# Initialise the cached rendered VHS tape
+		self._rendered: str | None = None
+
+	def _substitute(self, text: str) -> str:
+		"Substitute the files and directories into the given text"
+		return text.format(*self.files_and_directories)
+
+	@override
+	def __str__(self) -> str:
+		"Return the VHS tape as a string"
+
+		# If the VHS tape has already been rendered,
+		# return the cached rendered VHS tape
+		if self._rendered is not None:
+			return self._rendered
+
+		# The buffer to render the VHS tape into
+		buffer = io.StringIO()
+
+		# The output file for the VHS tape
+		buffer.write(f"Output ../videos/{self.file_name}.mp4\n")
 
-			# Configuration for the VHS tape
-			CONFIG,
+		# The required programs for the VHS tape
+		buffer.write(self._require_block)
 
-			# The set up for the VHS tape
-			"Hide",
-			FAST_TYPING_SPEED,
-			CHANGE_TO_WORKING_DIRECTORY,
-			"\n".join(self.setup),
-			CLEAR_SCREEN,
+		# Configuration for the VHS tape
+		buffer.write("\n")
+		buffer.write(CONFIG)
 
-			# Set the normal typing speed
-			NORMAL_TYPING_SPEED,
+		# The set up for the VHS tape
+		buffer.write("\n")
+		buffer.write(SETUP_PREAMBLE)
+		buffer.write("\n")
+		buffer.write("\n".join(self.setup))
 
-			# Show the output
-			"Show",
+		# Show the output at the normal typing speed
+		buffer.write("\n")
+		buffer.write(SETUP_TO_DEMO_TRANSITION)
 
-			# The shell body of the VHS tape
-			"\n".join(self.shell_body),
+		# The shell body of the VHS tape
+		buffer.write("\n")
+		buffer.write("\n".join(self.shell_body))
 
-			# Open the Yazi program
+		# Open the Yazi program
+		buffer.write("\n")
+		buffer.write(
 			'Type "{}" Enter'.format(
 				f"EDITOR='{self.editor}' yazi" if self.editor else "yazi"
-			),
-			SLEEP_TIME,
-
-			# The yazi body of the VHS tape
-			"\n".join(self.yazi_body),
-		]
+			)
+		)
+		buffer.write("\n")
+		buffer.write(SLEEP_TIME)
 
-		# fmt: on
+		# The yazi body of the VHS tape
+		buffer.write("\n")
+		buffer.write("\n".join(self.yazi_body))
 
 		# If quitting yazi is not skipped
 		if not self.skip_quitting_yazi:
 			#
 
-			# The commands to quit yazi
-			quit_yazi_commands = [
-				SLEEP_TIME,
-				'Type "q"',
-				SHORT_SLEEP_TIME,
-			]
+			# Add the commands to quit yazi to the VHS tape
+			buffer.write("\n")
+			buffer.write(QUIT_YAZI_BLOCK)
 
-			# Add the commands to the VHS tape
-			lines.extend(quit_yazi_commands)
-
-		# If there are clean up commands,
-		# or there are files and directories to clean up
-		if self.clean_up or files_and_directories_to_clean_up:
-			#
-
-			# Set the clean up section
-			clean_up_section = [
-				"Hide",
-				FAST_TYPING_SPEED,
-				"\n".join(self.clean_up),
-				(
-					"Type 'rm -rf {}' Enter".format(
-						" ".join(files_and_directories_to_clean_up)
-					)
-					if files_and_directories_to_clean_up
-					else ""
-				),
-			]
+		# If there is a clean up block,
+		# add it to the VHS tape
+		if self._clean_up_block:
+			buffer.write("\n")
+			buffer.write(self._clean_up_block)
 
-			# Add the clean up section to the lines
-			lines.extend(clean_up_section)
+		# The vhs tape, with runs of consecutive
+		# Sleep commands merged into one
+		vhs_tape = consolidate_sleep_commands(buffer.getvalue().strip())
 
-		# The vhs tape
-		vhs_tape = "\n".join(lines).format(*self.files_and_directories).strip()
+		# Cache the rendered VHS tape
+		self._rendered = vhs_tape
 
 		# Return the vhs tape
 		return vhs_tape
@@ -377,6 +615,54 @@ class VHSTape:
 		"Return the VHS tape as a string"
 		return self.__str__()
 
+	def get_content_hash(self) -> str:
+		"""
+		Return the hash of the rendered VHS tape.
+
+		The hash of the plugin's Lua source files is mixed in
+		so that editing the plugin re-renders every video,
+		as the videos demonstrate the plugin's behaviour,
+		not just the tape text.
+		"""
+
+		# Initialise the hash object with the rendered VHS tape
+		blake2b = hashlib.blake2b(self.to_string().encode("utf-8"))
+
+		# Add the hash of the plugin's Lua source files
+		blake2b.update(get_plugin_source_hash().encode("utf-8"))
+
+		# Return the hash of the VHS tape
+		return blake2b.hexdigest()
+
+	def get_hash_file_path(self) -> Path:
+		"Return the path to the file caching the hash of the VHS tape"
+		return Path(VHS_CACHE_DIRECTORY, f"{self.file_name}.blake2b")
+
+	def is_unchanged(self) -> bool:
+		"""
+		Return whether the VHS tape is unchanged since the last run,
+		which is when the video for the VHS tape exists and the cached
+		hash matches the hash of the rendered VHS tape.
+		"""
+
+		# The path to the video for the VHS tape
+		video_file_path = Path(VIDEOS_DIRECTORY, f"{self.file_name}.mp4")
+
+		# If the video for the VHS tape does not exist,
+		# the VHS tape needs to be rendered
+		if not video_file_path.is_file():
+			return False
+
+		# The path to the file caching the hash of the VHS tape
+		hash_file_path = self.get_hash_file_path()
+
+		# The VHS tape is unchanged when the cached hash
+		# matches the hash of the rendered VHS tape
+		return (
+			hash_file_path.is_file()
+			and hash_file_path.read_text() == self.get_content_hash()
+		)
+
 	def get_file_path(self) -> str:
 		"Return the file name for the VHS tape"
 		return f"./vhs-tapes/{self.file_name}.tape"
@@ -392,6 +678,7 @@ class VHSTape:
 			file.write(self.to_string())
 
 	@staticmethod
+	@functools.lru_cache(maxsize=None)
 	def edit_plugin_config(
 		config_option: str,
 		value: int | float | str | bool,
@@ -451,25 +738,18 @@ class VHSTape:
 
 		# Return the script object
 		return Script(
-			setup=setup_commands,
-			clean_up=clean_up_commands,
-			required_programs=["sed"],
+			setup="\n".join(setup_commands),
+			clean_up="\n".join(clean_up_commands),
+			required_programs=("sed",),
 		)
 
 	@staticmethod
 	def toggle_between_two_items(number_of_times: int) -> str:
 		"Return a command to quickly toggle the selection between two items"
-		return "\n".join(
-			[
-				"Ctrl+n",
-				VERY_SHORT_SLEEP_TIME,
-				"Ctrl+p",
-				VERY_SHORT_SLEEP_TIME,
-			]
-			* number_of_times
-		)
+		return (TOGGLE_SELECTION_BLOCK * number_of_times).removesuffix("\n")
 
 	@staticmethod
+	@functools.lru_cache(maxsize=None)
 	def create_nested_archive(
 		number_of_nested_archives: int,
 		archive_file_name: str = "demo.zip",
@@ -501,22 +781,18 @@ class VHSTape:
 		nested_archive_names = " ".join(nested_archive_names_list)
 
 		# The command to create the archive
-		create_archive_command = 'Type "7z a {} {}" Enter'.format(
-			archive_file_name,
-			nested_archive_names,
+		create_archive_command = (
+			f'Type "7z a {archive_file_name} {nested_archive_names}" Enter'
 		)
 
 		# The command to remove all of the extra archives and the file
-		clean_up_commands = 'Type "rm {} {}" Enter'.format(
-			text_file_name,
-			nested_archive_names,
+		clean_up_commands = (
+			f'Type "rm {text_file_name} {nested_archive_names}" Enter'
 		)
 
 		# The command to create the nested archive
 		create_nested_archive_command = [
-			"Type `echo '{}' > {}` Enter".format(
-				text_file_content, text_file_name
-			),
+			f"Type `echo '{text_file_content}' > {text_file_name}` Enter",
 			nested_archive_commands,
 			create_archive_command,
 			clean_up_commands,
@@ -524,8 +800,8 @@ class VHSTape:
 
 		# Return the script object
 		return Script(
-			setup=create_nested_archive_command,
-			required_programs=["echo", "7z", "rm"],
+			setup="\n".join(create_nested_archive_command),
+			required_programs=("echo", "7z", "rm"),
 		)
 
 	@staticmethod
@@ -542,7 +818,7 @@ class VHSTape:
 		setup_scripts: list[str] = []
 
 		# Initialise the required programs
-		required_programs: list[str] = []
+		required_programs: tuple[str, ...] = ()
 
 		# Iterate over the number of archives to create
 		for number in range(number_of_archives):
@@ -563,11 +839,12 @@ class VHSTape:
 
 		# Return the script object
 		return Script(
-			setup=setup_scripts,
+			setup="\n".join(setup_scripts),
 			required_programs=required_programs,
 		)
 
 	@staticmethod
+	@functools.lru_cache(maxsize=None)
 	def create_encrypted_archive(
 		archive_file_name: str = "demo.7z",
 		archive_password: str = "password",
@@ -581,27 +858,25 @@ class VHSTape:
 		to create an encrypted archive.
 		"""
 
+		# The flag to encrypt the archive headers
+		encrypt_headers_flag = "-mhe=on" if encrypt_headers else ""
+
 		# The commands to create the encrypted archive
 		create_encrypted_archive_commands = [
-			"Type `echo '{}' > {}` Enter".format(
-				text_file_content, text_file_name
-			),
-			"Type '7z a {} -p{} {} {}' Enter".format(
-				"-mhe=on" if encrypt_headers else "",
-				archive_password,
-				archive_file_name,
-				text_file_name,
-			),
+			f"Type `echo '{text_file_content}' > {text_file_name}` Enter",
+			f"Type '7z a {encrypt_headers_flag} -p{archive_password} "
+			+ f"{archive_file_name} {text_file_name}' Enter",
 			f"Type `rm {text_file_name}` Enter",
 		]
 
 		# Return the script object
 		return Script(
-			setup=create_encrypted_archive_commands,
-			required_programs=["echo", "7z", "rm"],
+			setup="\n".join(create_encrypted_archive_commands),
+			required_programs=("echo", "7z", "rm"),
 		)
 
 	@staticmethod
+	@functools.lru_cache(maxsize=None)
 	def create_keymap_toml(contents: str) -> Script:
 		"""
 		Returns a script object that contains the
@@ -642,7 +917,7 @@ class VHSTape:
 		return Script(
 			setup=create_keymap_toml_command,
 			clean_up=clean_up_keymap_toml_command,
-			required_programs=["mv", "echo", "rm"],
+			required_programs=("mv", "echo", "rm"),
 		)
 
 	@staticmethod
@@ -681,28 +956,18 @@ class VHSTape:
 		```
 		"""
 
-		# The keybinds in the keymap.toml file
-		keybinds: list[str] = []
-
-		# Iterate over the keymap
-		for key, command in keymap.items():
-			#
-
-			# Create the keybind for the key
-			keybind = VHSTape.create_keymap_toml_keybind(key, command)
-
-			# Add the keybind to the list
-			keybinds.append(keybind)
-
-		# Combine all the keybinds into a single string
-		keybinds_str = "\n".join(keybinds)
-
 		# Create and return the keymap.toml file
-		return VHSTape.create_keymap_toml(keybinds_str)
+		return VHSTape.create_keymap_toml(
+			"\n".join(
+				VHSTape.create_keymap_toml_keybind(key, command)
+				for key, command in keymap.items()
+			)
+		)
 
 	@staticmethod
+	@functools.lru_cache(maxsize=None)
 	def create_shell_keymap_toml(
-		key: str, shell_command: str, flags: list[str]
+		key: str, shell_command: str, flags: tuple[str, ...]
 	) -> Script:
 		"Create the keymap.toml file for the shell command demo"
 
@@ -713,9 +978,8 @@ class VHSTape:
 		]
 
 		# The shell command as an argument
-		shell_command = 'shell -- "{}" {}'.format(
-			shell_command,
-			" ".join(standardised_flags),
+		shell_command = (
+			f'shell -- "{shell_command}" {" ".join(standardised_flags)}'
 		)
 
 		# The contents of the keymap.toml file
@@ -725,6 +989,7 @@ class VHSTape:
 		return VHSTape.create_keymap_toml(contents)
 
 	@staticmethod
+	@functools.lru_cache(maxsize=None)
 	def create_tab_switch_keymap_toml() -> Script:
 		"Create the keymap.toml file for the tab switch demo"
 
@@ -745,7 +1010,7 @@ class VHSTape:
 		command = f"Copy '{text}'"
 
 		# Return the scrip to copy the given text to the clipboard
-		return Script(setup=[command])
+		return Script(setup=command)
 
 	@staticmethod
 	def press_key_repeatedly(
@@ -754,2371 +1019,2365 @@ class VHSTape:
 		delay_in_ms: int = 250,
 	) -> str:
 		"Return the command to cycle through the tabs"
-		return 'Type@{}ms "{}"'.format(delay_in_ms, key * number_of_times)
-
-
-# The dictionary containing the tapes for all demos
-VHS_TAPES: list[VHSTape] = [
-	VHSTape(
-		name="Open prompt",
-		scripts=[
-			VHSTape.edit_plugin_config("prompt", True),
-		],
-		yazi_body=[
-			f'Type "/{FIRST_FILE_NAME}" Enter',
-			"Space@300ms 3",
-			'Type "l"',
-			SLEEP_TIME,
-			'Type "h"',
-			SLEEP_TIME,
-			"Enter",
-			'Space Type "jb"',
-			LONG_SLEEP_TIME,
-			"Ctrl+c",
-			SHORT_SLEEP_TIME,
-			'Type ":q!" Enter',
-			SLEEP_TIME,
-			'Type "l"',
-			SLEEP_TIME,
-			'Type "s"',
-			SLEEP_TIME,
-			"Enter",
-			'Space Type "jb"',
-			VHSTape.toggle_between_two_items(3),
-			SHORT_SLEEP_TIME,
-			"Ctrl+c",
-			SHORT_SLEEP_TIME,
-			'Type ":q!" Enter',
-			SLEEP_TIME,
-			'Type "l"',
-			SLEEP_TIME,
-			"Enter",
-			'Space Type "jb"',
-			LONG_SLEEP_TIME,
-			"Ctrl+c",
-			SHORT_SLEEP_TIME,
-			'Type ":q!" Enter',
-		],
-	),
-	VHSTape(
-		name="Open behaviour",
-		yazi_body=[
-			f'Type "/{FIRST_FILE_NAME}" Enter',
-			"Space@300ms 3",
-			'Type "l"',
-			SLEEP_TIME,
-			'Space Type "jb"',
-			LONG_SLEEP_TIME,
-			"Ctrl+c",
-			SHORT_SLEEP_TIME,
-			'Type ":q!" Enter',
-			SLEEP_TIME,
-			'Type "k"',
-			SHORT_SLEEP_TIME,
-			'Type "l"',
-			'Space Type "jb"',
-			VHSTape.toggle_between_two_items(3),
-			SHORT_SLEEP_TIME,
-			"Ctrl+c",
-			SHORT_SLEEP_TIME,
-			'Type ":q!" Enter',
-		],
-	),
-	VHSTape(
-		name="Open auto extract archives",
-		files_and_directories=["demo.zip"],
-		scripts=[
-			VHSTape.edit_plugin_config("recursively_extract_archives", False),
-			VHSTape.create_nested_archive(4, "{0}"),
-		],
-		yazi_body=[
-			'Type "/{0}" Enter',
-			SLEEP_TIME,
-			'Type "l"',
-			SLEEP_TIME,
-			'Type "h"',
-		],
-	),
-	VHSTape(
-		name="Open recursively extract archives",
-		files_and_directories=["demo.zip"],
-		scripts=[
-			VHSTape.create_nested_archive(4, "{0}"),
-		],
-		shell_body=[
-			"Type `7z l {0}` Enter",
-			LONG_SLEEP_TIME,
-		],
-		yazi_body=[
-			'Type "/{0}" Enter',
-			SLEEP_TIME,
-			'Type "l"',
-			SLEEP_TIME,
-			'Type "h"',
-		],
-	),
-	VHSTape(
-		name="Extract must have hovered item",
-		files_and_directories=[
-			"demo-1.zip",
-			"demo-2.zip",
-			"demo-3.zip",
-			"demo-4.zip",
-			"demo-1",
-		],
-		scripts=[
-			VHSTape.edit_plugin_config("recursively_extract_archives", False),
-			VHSTape.create_keymap_toml_with_keymap({DEFAULT_KEY: "extract"}),
-			VHSTape.create_multiple_nested_archives(4, 4),
-		],
-		yazi_body=[
-			'Type "/{0}" Enter',
-			SLEEP_TIME,
-			'Type "j"',
-			"Space@300ms 3",
-			SLEEP_TIME,
-			f'Type "/{EMPTY_FOLDER}" Enter',
-			SLEEP_TIME,
-			'Type "l"',
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			LONG_SLEEP_TIME,
-			'Type "h"',
-			SLEEP_TIME,
-			'Type "/{0}" Enter',
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			SLEEP_TIME,
-			'Type "gg"',
-			SLEEP_TIME,
-			'Type "/{4}" Enter',
-		],
-	),
-	VHSTape(
-		name="Extract hovered item optional",
-		files_and_directories=[
-			"demo-1.zip",
-			"demo-2.zip",
-			"demo-3.zip",
-			"demo-4.zip",
-			"demo-2",
-			"demo-3",
-			"demo-4",
-			"demo-1",
-		],
-		scripts=[
-			VHSTape.edit_plugin_config("recursively_extract_archives", False),
-			VHSTape.edit_plugin_config("must_have_hovered_item", False),
-			VHSTape.create_keymap_toml_with_keymap({DEFAULT_KEY: "extract"}),
-			VHSTape.create_multiple_nested_archives(4, 4),
-		],
-		yazi_body=[
-			'Type "/{0}" Enter',
-			SLEEP_TIME,
-			'Type "j"',
-			"Space@300ms 3",
-			SLEEP_TIME,
-			f'Type "/{EMPTY_FOLDER}" Enter',
-			SLEEP_TIME,
-			'Type "l"',
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			SLEEP_TIME,
-			'Type "h"',
-			SLEEP_TIME,
-			'Type "gg"',
-			SLEEP_TIME,
-			'Type "/{4}" Enter',
-			SLEEP_TIME,
-			'Type "j"',
-			SLEEP_TIME,
-			'Type "j"',
-			SLEEP_TIME,
-			'Type "/{0}" Enter',
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			SLEEP_TIME,
-			'Type "gg"',
-			SLEEP_TIME,
-			'Type "/{7}" Enter',
-		],
-	),
-	VHSTape(
-		name="Extract prompt",
-		files_and_directories=[
-			"demo-1.zip",
-			"demo-2.zip",
-			"demo-3.zip",
-			"demo-4.zip",
-			"demo-1",
-			"demo-4",
-			"demo-4_1",
-		],
-		scripts=[
-			VHSTape.edit_plugin_config("recursively_extract_archives", False),
-			VHSTape.edit_plugin_config("prompt", True),
-			VHSTape.create_keymap_toml_with_keymap({DEFAULT_KEY: "extract"}),
-			VHSTape.create_multiple_nested_archives(4, 4),
-		],
-		yazi_body=[
-			'Type "/{0}" Enter',
-			SLEEP_TIME,
-			"Space@300ms 3",
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			SLEEP_TIME,
-			'Type "h"',
-			SLEEP_TIME,
-			"Enter",
-			SLEEP_TIME,
-			'Type "gg"',
-			SLEEP_TIME,
-			'Type "/{5}" Enter',
-			SLEEP_TIME,
-			'Type "/{3}" Enter',
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			SLEEP_TIME,
-			'Type "s"',
-			SLEEP_TIME,
-			"Enter",
-			SLEEP_TIME,
-			'Type "gg"',
-			SLEEP_TIME,
-			'Type "/{4}" Enter',
-			SLEEP_TIME,
-			'Type "j"',
-			SLEEP_TIME,
-			'Type "j"',
-			SLEEP_TIME,
-			'Type "/{3}" Enter',
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			SLEEP_TIME,
-			"Enter",
-			SLEEP_TIME,
-			'Type "gg"',
-			SLEEP_TIME,
-			'Type "/{6}" Enter',
-		],
-	),
-	VHSTape(
-		name="Extract behaviour",
-		files_and_directories=[
-			"demo-1.zip",
-			"demo-2.zip",
-			"demo-3.zip",
-			"demo-4.zip",
-			"demo-5.zip",
-			"demo-4",
-			"demo-1",
-		],
-		scripts=[
-			VHSTape.edit_plugin_config("recursively_extract_archives", False),
-			VHSTape.create_keymap_toml_with_keymap({DEFAULT_KEY: "extract"}),
-			VHSTape.create_multiple_nested_archives(5, 4),
-		],
-		yazi_body=[
-			'Type "/{0}" Enter',
-			SLEEP_TIME,
-			"Space@300ms 3",
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			SLEEP_TIME,
-			'Type "gg"',
-			SLEEP_TIME,
-			'Type "/{5}" Enter',
-			SLEEP_TIME,
-			'Type "/{0}" Enter',
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			SLEEP_TIME,
-			'Type "gg"',
-			SLEEP_TIME,
-			'Type "/{6}" Enter',
-			SLEEP_TIME,
-			'Type "j"',
-			SLEEP_TIME,
-			'Type "j"',
-		],
-	),
-	VHSTape(
-		name="Extract recursively extract archives",
-		files_and_directories=["demo.zip", "demo"],
-		scripts=[
-			VHSTape.create_keymap_toml_with_keymap({DEFAULT_KEY: "extract"}),
-			VHSTape.create_nested_archive(4, "{0}"),
-		],
-		shell_body=[
-			"Type `7z l {0}` Enter",
-			LONG_SLEEP_TIME,
-		],
-		yazi_body=[
-			'Type "/{0}" Enter',
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			SLEEP_TIME,
-			'Type "gg"',
-			SLEEP_TIME,
-			'Type "/{1}" Enter',
-			SLEEP_TIME,
-			'Type "l"',
-		],
-	),
-	VHSTape(
-		name="Extract encrypted archive",
-		files_and_directories=["demo.7z", "demo.txt"],
-		scripts=[
-			VHSTape.create_keymap_toml_with_keymap({DEFAULT_KEY: "extract"}),
-			VHSTape.create_encrypted_archive(
-				archive_file_name="{0}",
-				archive_password="{0}",
-			),
-		],
-		yazi_body=[
-			'Type "/{0}" Enter',
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			SLEEP_TIME,
-			'Type "password" Enter',
-			SLEEP_TIME,
-			'Type "wrong password" Enter',
-			SLEEP_TIME,
-			'Type "still wrong password" Enter',
-			SLEEP_TIME,
-			'Type "LET ME IN!1!1!1!" Enter',
-			SLEEP_TIME,
-			'Type "w"',
-			SLEEP_TIME,
-			"Enter",
-			SLEEP_TIME,
-			'Type "q"',
-			SLEEP_TIME,
-			'Type "x"',
-			SLEEP_TIME,
-			"Ctrl+c",
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			SLEEP_TIME,
-			'Type "{0}" Enter',
-			SLEEP_TIME,
-			'Type "/{1}" Enter',
-		],
-	),
-	VHSTape(
-		name="Extract reveal extracted item",
-		files_and_directories=[
-			"demo.zip",
-			"demo",
-			"demo_1",
-			"demo_2",
-		],
-		scripts=[
-			VHSTape.create_keymap_toml_with_keymap(
-				{DEFAULT_KEY: "extract -- --reveal"}
-			),
-			VHSTape.create_nested_archive(4, "{0}"),
-		],
-		yazi_body=[
-			'Type "/{0}" Enter',
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			SLEEP_TIME,
-			'Type "h"',
-			SLEEP_TIME,
-			'Type "n"',
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			SLEEP_TIME,
-			'Type "h"',
-			SLEEP_TIME,
-			'Type "n"',
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-		],
-	),
-	VHSTape(
-		name="Extract remove extracted archive",
-		files_and_directories=["demo.zip"],
-		scripts=[
-			VHSTape.create_keymap_toml_with_keymap(
-				{DEFAULT_KEY: "extract -- --remove"}
-			),
-			VHSTape.create_nested_archive(4, "{0}"),
-		],
-		yazi_body=[
-			'Type "/{0}" Enter',
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			SLEEP_TIME,
-			'Type "/{0}" Enter',
-		],
-	),
-	VHSTape(
-		name="Extract remove protected extracted archive",
-		files_and_directories=[
-			os.path.join(PROTECTED_FOLDER, "demo.zip"),
-			"demo.zip",
-		],
-		scripts=[
-			VHSTape.edit_plugin_config(
-				"protected_directories",
-				"".join(
-					[
-						r'{{"',
-						str(PROTECTED_DIRECTORY.absolute()),
-						r'"}}',
-					]
+
+		# If the key is a vhs special key, like Down or Backspace,
+		# use the key's own repeat syntax,
+		# as special keys cannot be typed
+		if len(key) > 1:
+			return f"{key}@{delay_in_ms}ms {number_of_times}"
+
+		# Otherwise, type the key the given number of times
+		return f'Type@{delay_in_ms}ms "{key * number_of_times}"'
+
+
+def create_vhs_tapes() -> list[VHSTape]:
+	"Create the list of VHS tapes for all the demos"
+	return [
+		VHSTape(
+			name="Open prompt",
+			scripts=[
+				VHSTape.edit_plugin_config("prompt", True),
+			],
+			yazi_body=[
+				f'Type "/{FIRST_FILE_NAME}" Enter',
+				"Space@300ms 3",
+				'Type "l"',
+				SLEEP_TIME,
+				'Type "h"',
+				SLEEP_TIME,
+				"Enter",
+				'Space Type "jb"',
+				LONG_SLEEP_TIME,
+				"Ctrl+c",
+				SHORT_SLEEP_TIME,
+				'Type ":q!" Enter',
+				SLEEP_TIME,
+				'Type "l"',
+				SLEEP_TIME,
+				'Type "s"',
+				SLEEP_TIME,
+				"Enter",
+				'Space Type "jb"',
+				VHSTape.toggle_between_two_items(3),
+				SHORT_SLEEP_TIME,
+				"Ctrl+c",
+				SHORT_SLEEP_TIME,
+				'Type ":q!" Enter',
+				SLEEP_TIME,
+				'Type "l"',
+				SLEEP_TIME,
+				"Enter",
+				'Space Type "jb"',
+				LONG_SLEEP_TIME,
+				"Ctrl+c",
+				SHORT_SLEEP_TIME,
+				'Type ":q!" Enter',
+			],
+		),
+		VHSTape(
+			name="Open behaviour",
+			yazi_body=[
+				f'Type "/{FIRST_FILE_NAME}" Enter',
+				"Space@300ms 3",
+				'Type "l"',
+				SLEEP_TIME,
+				'Space Type "jb"',
+				LONG_SLEEP_TIME,
+				"Ctrl+c",
+				SHORT_SLEEP_TIME,
+				'Type ":q!" Enter',
+				SLEEP_TIME,
+				'Type "k"',
+				SHORT_SLEEP_TIME,
+				'Type "l"',
+				'Space Type "jb"',
+				VHSTape.toggle_between_two_items(3),
+				SHORT_SLEEP_TIME,
+				"Ctrl+c",
+				SHORT_SLEEP_TIME,
+				'Type ":q!" Enter',
+			],
+		),
+		VHSTape(
+			name="Open auto extract archives",
+			files_and_directories=["demo.zip"],
+			scripts=[
+				VHSTape.edit_plugin_config(
+					"recursively_extract_archives", False
 				),
-				r"{{}}",
-			),
-			VHSTape.create_keymap_toml_with_keymap(
-				{DEFAULT_KEY: "extract -- --remove"}
-			),
-			VHSTape.create_nested_archive(4, "{0}"),
-		],
-		yazi_body=[
-			f'Type "/{PROTECTED_FOLDER}" Enter',
-			SLEEP_TIME,
-			'Type "l"',
-			SLEEP_TIME,
-			'Type "/{1}" Enter',
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			SLEEP_TIME,
-			"Ctrl+c",
-			SLEEP_TIME,
-			'Type "gg"',
-			SLEEP_TIME,
-			'Type "/{1}" Enter',
-		],
-	),
-	VHSTape(
-		name="Smart enter",
-		yazi_body=[
-			'Type "l"',
-			SLEEP_TIME,
-			'Type "h"',
-			SLEEP_TIME,
-			'Type "jl"',
-			SLEEP_TIME,
-			'Type "h"',
-			SLEEP_TIME,
-			'Type "jl"',
-			SLEEP_TIME,
-			'Type "h"',
-			SLEEP_TIME,
-			'Type "G"',
-			SLEEP_TIME,
-			'Type "l"',
-			SLEEP_TIME,
-			'Type ":q!" Enter',
-			SLEEP_TIME,
-			'Type "kl"',
-			SLEEP_TIME,
-			'Type ":q!" Enter',
-			SLEEP_TIME,
-			'Type "kl"',
-			SLEEP_TIME,
-			'Type ":q!" Enter',
-		],
-	),
-	VHSTape(
-		name="Enter skip single subdirectory",
-		yazi_body=[
-			f'Type "/{FOLDER_WITH_SUBDIRECTORY}" Enter',
-			SLEEP_TIME,
-			'Type "l"',
-			SLEEP_TIME,
-			"Left",
-			SLEEP_TIME,
-			"Left",
-		],
-	),
-	VHSTape(
-		name="Leave skip single subdirectory",
-		scripts=[
-			Script(
-				setup=f"Type `cd './{FOLDER_WITH_SUBDIRECTORY}/subdirectory/'`"
-				+ "Enter",
-			),
-		],
-		yazi_body=[
-			'Type "h"',
-			SLEEP_TIME,
-			f'Type "/{FOLDER_WITH_SUBDIRECTORY}" Enter',
-			"Right",
-			SLEEP_TIME,
-			"Right",
-		],
-	),
-	VHSTape(
-		name="Rename must have hovered item",
-		yazi_body=[
-			f'Type "/{FIRST_FILE_NAME}" Enter',
-			SLEEP_TIME,
-			'Type "j"',
-			"Space@300ms 3",
-			SLEEP_TIME,
-			f'Type "/{EMPTY_FOLDER}" Enter',
-			SLEEP_TIME,
-			'Type "l"',
-			SLEEP_TIME,
-			'Type "r"',
-			LONG_SLEEP_TIME,
-			'Type "h"',
-			SLEEP_TIME,
-			'Type "r"',
-			"Backspace@300ms 3",
-			SLEEP_TIME,
-			"Ctrl+c",
-		],
-	),
-	VHSTape(
-		name="Rename hovered item optional",
-		scripts=[
-			VHSTape.edit_plugin_config("must_have_hovered_item", False),
-		],
-		yazi_body=[
-			f'Type "/{FIRST_FILE_NAME}" Enter',
-			SLEEP_TIME,
-			'Type "j"',
-			"Space@300ms 3",
-			SLEEP_TIME,
-			f'Type "/{EMPTY_FOLDER}" Enter',
-			SLEEP_TIME,
-			'Type "l"',
-			SLEEP_TIME,
-			'Type "r"',
-			SLEEP_TIME,
-			'Type ":q!" Enter',
-			SLEEP_TIME,
-			'Type "h"',
-			SLEEP_TIME,
-			'Type "r"',
-			"Backspace@300ms 3",
-			SLEEP_TIME,
-			"Ctrl+c",
-		],
-	),
-	VHSTape(
-		name="Rename prompt",
-		scripts=[
-			VHSTape.edit_plugin_config("prompt", True),
-		],
-		yazi_body=[
-			f'Type "/{FIRST_FILE_NAME}" Enter',
-			"Space@300ms 3",
-			'Type "r"',
-			SLEEP_TIME,
-			'Type "h"',
-			SLEEP_TIME,
-			"Enter",
-			SLEEP_TIME,
-			"Escape",
-			'Type "b"',
-			SLEEP_TIME,
-			"Ctrl+c",
-			SLEEP_TIME,
-			'Type "r"',
-			SLEEP_TIME,
-			'Type "s"',
-			SLEEP_TIME,
-			"Enter",
-			SLEEP_TIME,
-			'Type ":q!" Enter',
-			SLEEP_TIME,
-			'Type "r"',
-			SLEEP_TIME,
-			"Enter",
-			SLEEP_TIME,
-			"Escape",
-			'Type "b"',
-			SLEEP_TIME,
-			"Ctrl+c",
-		],
-	),
-	VHSTape(
-		name="Rename behaviour",
-		yazi_body=[
-			f'Type "/{FIRST_FILE_NAME}" Enter',
-			"Space@300ms 3",
-			SLEEP_TIME,
-			'Type "r"',
-			SLEEP_TIME,
-			"Escape",
-			'Type "b"',
-			SLEEP_TIME,
-			"Ctrl+c",
-			SLEEP_TIME,
-			'Type "j"',
-			SLEEP_TIME,
-			'Type "r"',
-			SLEEP_TIME,
-			"Escape",
-			'Type "b"',
-			SLEEP_TIME,
-			"Ctrl+c",
-			SLEEP_TIME,
-			'Type "kk"',
-			SLEEP_TIME,
-			'Type "r"',
-			SLEEP_TIME,
-			'Type ":q!" Enter',
-		],
-	),
-	VHSTape(
-		name="Remove must have hovered item",
-		yazi_body=[
-			f'Type "/{FIRST_FILE_NAME}" Enter',
-			SLEEP_TIME,
-			'Type "j"',
-			"Space@300ms 3",
-			SLEEP_TIME,
-			f'Type "/{EMPTY_FOLDER}" Enter',
-			SLEEP_TIME,
-			'Type "l"',
-			'Type "x"',
-			LONG_SLEEP_TIME,
-			'Type "h"',
-			SLEEP_TIME,
-			'Type "x"',
-			SLEEP_TIME,
-			"Ctrl+c",
-		],
-	),
-	VHSTape(
-		name="Remove hovered item optional",
-		scripts=[
-			VHSTape.edit_plugin_config("must_have_hovered_item", False),
-		],
-		yazi_body=[
-			f'Type "/{FIRST_FILE_NAME}" Enter',
-			SLEEP_TIME,
-			'Type "j"',
-			"Space@300ms 3",
-			SLEEP_TIME,
-			f'Type "/{EMPTY_FOLDER}" Enter',
-			SLEEP_TIME,
-			'Type "l"',
-			SLEEP_TIME,
-			'Type "x"',
-			SLEEP_TIME,
-			"Ctrl+c",
-			SLEEP_TIME,
-			'Type "h"',
-			SLEEP_TIME,
-			'Type "x"',
-			SLEEP_TIME,
-			"Ctrl+c",
-		],
-	),
-	VHSTape(
-		name="Remove prompt",
-		scripts=[
-			VHSTape.edit_plugin_config("prompt", True),
-		],
-		yazi_body=[
-			f'Type "/{FIRST_FILE_NAME}" Enter',
-			"Space@300ms 3",
-			'Type "x"',
-			SLEEP_TIME,
-			'Type "h"',
-			SLEEP_TIME,
-			"Enter",
-			SLEEP_TIME,
-			"Ctrl+c",
-			SLEEP_TIME,
-			'Type "x"',
-			SLEEP_TIME,
-			'Type "s"',
-			SLEEP_TIME,
-			"Enter",
-			SLEEP_TIME,
-			"Ctrl+c",
-			SLEEP_TIME,
-			'Type "x"',
-			SLEEP_TIME,
-			"Enter",
-			SLEEP_TIME,
-			"Ctrl+c",
-		],
-	),
-	VHSTape(
-		name="Remove protected directory",
-		files_and_directories=[
-			"demo-1.txt",
-			"demo-2.txt",
-			"demo-3.txt",
-			"demo-4.txt",
-			"demo-5.txt",
-			os.path.join(PROTECTED_FOLDER, "demo-1.txt"),
-			os.path.join(PROTECTED_FOLDER, "demo-2.txt"),
-			os.path.join(PROTECTED_FOLDER, "demo-3.txt"),
-			os.path.join(PROTECTED_FOLDER, "demo-4.txt"),
-			os.path.join(PROTECTED_FOLDER, "demo-5.txt"),
-		],
-		scripts=[
-			VHSTape.edit_plugin_config(
-				"protected_directories",
-				"".join(
-					[
-						r'{{"',
-						str(PROTECTED_DIRECTORY.absolute()),
-						r'"}}',
-					]
+				VHSTape.create_nested_archive(4, "{0}"),
+			],
+			yazi_body=OPEN_HOVERED_ARCHIVE_BODY,
+		),
+		VHSTape(
+			name="Open recursively extract archives",
+			files_and_directories=["demo.zip"],
+			scripts=[
+				VHSTape.create_nested_archive(4, "{0}"),
+			],
+			shell_body=[
+				"Type `7z l {0}` Enter",
+				LONG_SLEEP_TIME,
+			],
+			yazi_body=OPEN_HOVERED_ARCHIVE_BODY,
+		),
+		VHSTape(
+			name="Extract must have hovered item",
+			files_and_directories=[
+				"demo-1.zip",
+				"demo-2.zip",
+				"demo-3.zip",
+				"demo-4.zip",
+				"demo-1",
+			],
+			scripts=[
+				VHSTape.edit_plugin_config(
+					"recursively_extract_archives", False
 				),
-				r"{{}}",
-			),
-			VHSTape.create_keymap_toml_with_keymap(
-				{DEFAULT_KEY: "remove -- --permanently --force"}
-			),
-			Script(
-				setup="".join(
-					[
-						"Type `touch ",
-						" ".join("'{" + str(i) + "}'" for i in range(0, 10)),
-						"` Enter",
-					]
+				VHSTape.create_keymap_toml_with_keymap(
+					{DEFAULT_KEY: "extract"}
 				),
-				required_programs=["touch"],
-			),
-		],
-		yazi_body=[
-			'Type "/{0}" Enter',
-			"Space@300ms 3",
-			f'Type "{DEFAULT_KEY}"',
-			SLEEP_TIME,
-			'Type "k"',
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			SLEEP_TIME,
-			f'Type "/{PROTECTED_FOLDER}" Enter',
-			SLEEP_TIME,
-			'Type "l"',
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			SLEEP_TIME,
-			"Ctrl+c",
-			SLEEP_TIME,
-			'Type "j"',
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			SLEEP_TIME,
-			"Ctrl+c",
-			SLEEP_TIME,
-			"Space@300ms 3",
-			'Type "k"',
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			SLEEP_TIME,
-			"Ctrl+c",
-		],
-	),
-	VHSTape(
-		name="Remove behaviour",
-		yazi_body=[
-			f'Type "/{FIRST_FILE_NAME}" Enter',
-			"Space@300ms 3",
-			SLEEP_TIME,
-			'Type "x"',
-			SLEEP_TIME,
-			"Ctrl+c",
-			SLEEP_TIME,
-			'Type "j"',
-			SLEEP_TIME,
-			'Type "x"',
-			SLEEP_TIME,
-			"Ctrl+c",
-			SLEEP_TIME,
-			'Type "kk"',
-			SLEEP_TIME,
-			'Type "x"',
-			SLEEP_TIME,
-			"Ctrl+c",
-		],
-	),
-	VHSTape(
-		name="Copy must have hovered item",
-		scripts=[
-			VHSTape.copy_text_to_clipboard(),
-		],
-		yazi_body=[
-			f'Type "/{FIRST_FILE_NAME}" Enter',
-			SLEEP_TIME,
-			'Type "j"',
-			"Space@300ms 3",
-			SLEEP_TIME,
-			f'Type "/{EMPTY_FOLDER}" Enter',
-			SLEEP_TIME,
-			'Type "l"',
-			SLEEP_TIME,
-			'Type "cf"',
-			SLEEP_TIME,
-			'Type ":" Escape',
-			'Type "p"',
-			SLEEP_TIME,
-			"Ctrl+c",
-			SLEEP_TIME,
-			'Type "h"',
-			SLEEP_TIME,
-			'Type "cf"',
-			SLEEP_TIME,
-			'Type ":" Escape',
-			'Type "p"',
-			SLEEP_TIME,
-			"Ctrl+c",
-		],
-	),
-	VHSTape(
-		name="Copy hovered item optional",
-		scripts=[
-			VHSTape.copy_text_to_clipboard(),
-			VHSTape.edit_plugin_config("must_have_hovered_item", False),
-		],
-		yazi_body=[
-			f'Type "/{FIRST_FILE_NAME}" Enter',
-			SLEEP_TIME,
-			'Type "j"',
-			"Space@300ms 3",
-			SLEEP_TIME,
-			f'Type "/{EMPTY_FOLDER}" Enter',
-			SLEEP_TIME,
-			'Type "l"',
-			SLEEP_TIME,
-			'Type "cf"',
-			SLEEP_TIME,
-			'Type ":" Escape',
-			'Type "p"',
-			SLEEP_TIME,
-			"Ctrl+c",
-			SLEEP_TIME,
-			'Type "h"',
-			SLEEP_TIME,
-			'Type "cf"',
-			SLEEP_TIME,
-			'Type ":" Escape',
-			'Type "p"',
-			SLEEP_TIME,
-			"Ctrl+c",
-		],
-	),
-	VHSTape(
-		name="Copy prompt",
-		scripts=[
-			VHSTape.copy_text_to_clipboard(),
-			VHSTape.edit_plugin_config("prompt", True),
-		],
-		yazi_body=[
-			f'Type "/{FIRST_FILE_NAME}" Enter',
-			"Space@300ms 3",
-			'Type "cf"',
-			SLEEP_TIME,
-			'Type "h"',
-			SLEEP_TIME,
-			"Enter",
-			SLEEP_TIME,
-			'Type ":" Escape',
-			'Type "p"',
-			SLEEP_TIME,
-			"Ctrl+c",
-			SLEEP_TIME,
-			'Type "cf"',
-			SLEEP_TIME,
-			'Type "s"',
-			SLEEP_TIME,
-			"Enter",
-			SLEEP_TIME,
-			'Type ":" Escape',
-			'Type "p"',
-			SLEEP_TIME,
-			"Ctrl+c",
-			SLEEP_TIME,
-			'Type "cf"',
-			SLEEP_TIME,
-			"Enter",
-			SLEEP_TIME,
-			'Type ":" Escape',
-			'Type "p"',
-			SLEEP_TIME,
-			"Ctrl+c",
-		],
-	),
-	VHSTape(
-		name="Copy behaviour",
-		scripts=[
-			VHSTape.copy_text_to_clipboard(),
-		],
-		yazi_body=[
-			f'Type "/{FIRST_FILE_NAME}" Enter',
-			"Space@300ms 3",
-			SLEEP_TIME,
-			'Type "cf"',
-			SLEEP_TIME,
-			'Type ":" Escape',
-			'Type "p"',
-			SLEEP_TIME,
-			"Ctrl+c",
-			SLEEP_TIME,
-			'Type "j"',
-			SLEEP_TIME,
-			'Type "cf"',
-			SLEEP_TIME,
-			'Type ":" Escape',
-			'Type "p"',
-			SLEEP_TIME,
-			"Ctrl+c",
-			SLEEP_TIME,
-			'Type "kk"',
-			SLEEP_TIME,
-			'Type "cf"',
-			SLEEP_TIME,
-			'Type ":" Escape',
-			'Type "p"',
-			SLEEP_TIME,
-			"Ctrl+c",
-		],
-	),
-	VHSTape(
-		name="Create behaviour",
-		files_and_directories=[
-			"demo_file.txt",
-			"test_file.txt",
-			"demo_dir",
-			"test_dir",
-			"demo_dir.txt",
-			"dir_to_overwrite",
-			"file_to_overwrite.txt",
-		],
-		scripts=[
-			Script(
-				setup="Type `mkdir '{5}'` Enter", required_programs=["mkdir"]
-			),
-			Script(
-				setup="Type `touch '{6}'` Enter", required_programs=["touch"]
-			),
-		],
-		yazi_body=[
-			'Type "_{0}" Enter',
-			SLEEP_TIME,
-			'Type "/{0}" Enter',
-			SLEEP_TIME,
-			'Type "_{1}" Enter',
-			SLEEP_TIME,
-			'Type "/{1}" Enter',
-			SLEEP_TIME,
-			'Type "_{2}" Enter',
-			SLEEP_TIME,
-			'Type "/{2}" Enter',
-			SLEEP_TIME,
-			'Type "_{3}/" Enter',
-			SLEEP_TIME,
-			'Type "/{3}" Enter',
-			SLEEP_TIME,
-			'Type "_{4}/"',
-			SLEEP_TIME,
-			"Enter",
-			SLEEP_TIME,
-			'Type "/{4}" Enter',
-			SLEEP_TIME,
-			'Type "_{5}" Enter',
-			SLEEP_TIME,
-			"Ctrl+c",
-			SLEEP_TIME,
-			'Type "/{5}" Enter',
-			SLEEP_TIME,
-			'Type "_{6}" Enter',
-			SLEEP_TIME,
-			"Ctrl+c",
-			SLEEP_TIME,
-			'Type "/{6}" Enter',
-		],
-	),
-	VHSTape(
-		name="Create and open files",
-		files_and_directories=[
-			"demo_file.txt",
-			"test_file.txt",
-			"demo_dir",
-			"test_dir",
-		],
-		scripts=[
-			VHSTape.edit_plugin_config("open_file_after_creation", True),
-		],
-		yazi_body=[
-			'Type "_{0}" Enter',
-			SLEEP_TIME,
-			'Type ":q!" Enter',
-			SLEEP_TIME,
-			'Type "_{1}" Enter',
-			SLEEP_TIME,
-			'Type ":q!" Enter',
-			SLEEP_TIME,
-			'Type "_{2}" Enter',
-			SLEEP_TIME,
-			'Type "/{2}" Enter',
-			SLEEP_TIME,
-			'Type "_{3}/" Enter',
-			SLEEP_TIME,
-			'Type "/{3}" Enter',
-		],
-	),
-	VHSTape(
-		name="Create and enter directories",
-		files_and_directories=[
-			"demo_dir",
-			"test_dir",
-			"demo_file.txt",
-			"test_file.txt",
-		],
-		scripts=[
-			VHSTape.edit_plugin_config("enter_directory_after_creation", True),
-		],
-		yazi_body=[
-			'Type "_{0}" Enter',
-			SLEEP_TIME,
-			'Type "h"',
-			SLEEP_TIME,
-			'Type "_{1}/"',
-			SLEEP_TIME,
-			"Enter",
-			SLEEP_TIME,
-			'Type "h"',
-			SLEEP_TIME,
-			'Type "_{2}" Enter',
-			SLEEP_TIME,
-			'Type "/{2}" Enter',
-			SLEEP_TIME,
-			'Type "_{3}" Enter',
-			SLEEP_TIME,
-			'Type "/{3}" Enter',
-		],
-	),
-	VHSTape(
-		name="Create and open files and directories",
-		files_and_directories=[
-			"demo_file.txt",
-			"test_file.txt",
-			"demo_dir",
-			"test_dir",
-		],
-		scripts=[
-			VHSTape.edit_plugin_config("open_file_after_creation", True),
-			VHSTape.edit_plugin_config("enter_directory_after_creation", True),
-		],
-		yazi_body=[
-			'Type "_{0}" Enter',
-			SLEEP_TIME,
-			'Type ":q!" Enter',
-			SLEEP_TIME,
-			'Type "_{1}" Enter',
-			SLEEP_TIME,
-			'Type ":q!" Enter',
-			SLEEP_TIME,
-			'Type "_{2}" Enter',
-			SLEEP_TIME,
-			'Type "h"',
-			SLEEP_TIME,
-			'Type "_{3}/" Enter',
-			SLEEP_TIME,
-			'Type "h"',
-		],
-	),
-	VHSTape(
-		name="Create default behaviour",
-		files_and_directories=[
-			"demo_file.txt",
-			"test_file.txt",
-			"demo_dir",
-			"test_dir",
-		],
-		scripts=[
-			VHSTape.edit_plugin_config("use_default_create_behaviour", True)
-		],
-		yazi_body=[
-			'Type "_{0}" Enter',
-			SLEEP_TIME,
-			'Type "/{0}" Enter',
-			SLEEP_TIME,
-			'Type "_{1}" Enter',
-			SLEEP_TIME,
-			'Type "/{1}" Enter',
-			SLEEP_TIME,
-			'Type "_{2}" Enter',
-			SLEEP_TIME,
-			'Type "/{2}" Enter',
-			SLEEP_TIME,
-			'Type "_{3}/" Enter',
-			SLEEP_TIME,
-			'Type "/{3}" Enter',
-		],
-	),
-	VHSTape(
-		name="Shell must have hovered item",
-		scripts=[
-			VHSTape.create_shell_keymap_toml(
-				DEFAULT_KEY, r"\$SHELL", ["block"]
-			),
-		],
-		yazi_body=[
-			f'Type "/{FIRST_FILE_NAME}" Enter',
-			SLEEP_TIME,
-			'Type "j"',
-			"Space@300ms 3",
-			SLEEP_TIME,
-			f'Type "/{EMPTY_FOLDER}" Enter',
-			SLEEP_TIME,
-			'Type "l"',
-			f'Type "{DEFAULT_KEY}"',
-			LONG_SLEEP_TIME,
-			'Type "h"',
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			SLEEP_TIME,
-			'Type "exit" Enter',
-		],
-	),
-	VHSTape(
-		name="Shell hovered item optional",
-		scripts=[
-			VHSTape.edit_plugin_config("must_have_hovered_item", False),
-			VHSTape.create_shell_keymap_toml(
-				DEFAULT_KEY, r"\$SHELL", ["block"]
-			),
-		],
-		yazi_body=[
-			f'Type "/{FIRST_FILE_NAME}" Enter',
-			SLEEP_TIME,
-			'Type "j"',
-			"Space@300ms 3",
-			SLEEP_TIME,
-			f'Type "/{EMPTY_FOLDER}" Enter',
-			SLEEP_TIME,
-			'Type "l"',
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			SLEEP_TIME,
-			'Type "exit" Enter',
-			SLEEP_TIME,
-			'Type "h"',
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			SLEEP_TIME,
-			'Type "exit" Enter',
-		],
-	),
-	VHSTape(
-		name="Shell prompt",
-		scripts=[
-			VHSTape.edit_plugin_config("prompt", True),
-			VHSTape.create_shell_keymap_toml(
-				DEFAULT_KEY, r"echo %s | less", ["block"]
-			),
-		],
-		yazi_body=[
-			f'Type "/{FIRST_FILE_NAME}" Enter',
-			"Space@300ms 3",
-			f'Type "{DEFAULT_KEY}"',
-			SLEEP_TIME,
-			'Type "h"',
-			SLEEP_TIME,
-			"Enter",
-			LONG_SLEEP_TIME,
-			'Type "q"',
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			SLEEP_TIME,
-			'Type "s"',
-			SLEEP_TIME,
-			"Enter",
-			LONG_SLEEP_TIME,
-			'Type "q"',
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			SLEEP_TIME,
-			"Enter",
-			LONG_SLEEP_TIME,
-			'Type "q"',
-		],
-	),
-	VHSTape(
-		name="Shell behaviour",
-		scripts=[
-			VHSTape.create_shell_keymap_toml(
-				DEFAULT_KEY, r"echo %s | less", ["block"]
-			),
-		],
-		yazi_body=[
-			f'Type "/{FIRST_FILE_NAME}" Enter',
-			"Space@300ms 3",
-			SLEEP_TIME,
-			'Type "k"',
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			LONG_SLEEP_TIME,
-			'Type "q"',
-			SLEEP_TIME,
-			'Type "j"',
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			LONG_SLEEP_TIME,
-			'Type "q"',
-			SLEEP_TIME,
-			'Type "j"',
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			LONG_SLEEP_TIME,
-			'Type "q"',
-		],
-	),
-	VHSTape(
-		name="Shell exit if directory",
-		scripts=[
-			VHSTape.create_shell_keymap_toml(
-				DEFAULT_KEY, r"\$SHELL", ["block", "exit-if-dir"]
-			),
-		],
-		yazi_body=[
-			f'Type "/{FIRST_FILE_NAME}" Enter',
-			"Space@300ms 3",
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			SLEEP_TIME,
-			'Type "exit" Enter',
-			SLEEP_TIME,
-			'Type "j"',
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			SLEEP_TIME,
-			'Type "exit" Enter',
-			SLEEP_TIME,
-			'Type "kk"',
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			SLEEP_TIME,
-			'Type "exit" Enter',
-			SLEEP_TIME,
-			'Type "gg"',
-			"Space@300ms 2",
-			'Type "k"',
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			SLEEP_TIME,
-			'Type "exit" Enter',
-			SLEEP_TIME,
-			"Escape 2",
-			'Type "gg"',
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			SLEEP_TIME,
-			'Type "j"',
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			SLEEP_TIME,
-			'Type "gg"',
-			"Space@300ms 2",
-			'Type "k"',
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-		],
-	),
-	VHSTape(
-		name="Smart paste",
-		files_and_directories=[
-			"demo.txt",
-			"demo_1.txt",
-			"**/demo.txt",
-			"**/demo_1.txt",
-		],
-		scripts=[
-			VHSTape.edit_plugin_config("smart_paste", True),
-			Script(
-				setup=f"Type `echo '{DEFAULT_TEXT_FILE_CONTENT}' "
-				+ "> {0}` Enter",
-				required_programs=["echo"],
-			),
-		],
-		yazi_body=[
-			'Type "/{0}" Enter',
-			'Type "y"',
-			SLEEP_TIME,
-			'Type "gg"',
-			SLEEP_TIME,
-			'Type "p"',
-			SLEEP_TIME,
-			'Type "l"',
-			SLEEP_TIME,
-			'Type "/{0}" Enter',
-			SLEEP_TIME,
-			'Type "h"',
-			SLEEP_TIME,
-			'Type "j"',
-			SLEEP_TIME,
-			'Type "p"',
-			SLEEP_TIME,
-			'Type "l"',
-			SLEEP_TIME,
-			'Type "n"',
-			SLEEP_TIME,
-			'Type "h"',
-			SLEEP_TIME,
-			'Type "j"',
-			SLEEP_TIME,
-			'Type "p"',
-			SLEEP_TIME,
-			'Type "l"',
-			SLEEP_TIME,
-			'Type "n"',
-			SLEEP_TIME,
-			'Type "k"',
-			SLEEP_TIME,
-			'Type "p"',
-			SLEEP_TIME,
-			'Type "l"',
-			SLEEP_TIME,
-			'Type "hh"',
-			SLEEP_TIME,
-			'Type "n"',
-			SLEEP_TIME,
-			'Type "p"',
-			SLEEP_TIME,
-			'Type "/{1}" Enter',
-		],
-	),
-	VHSTape(
-		name="Smart tab create",
-		scripts=[
-			VHSTape.edit_plugin_config("smart_tab_create", True),
-		],
-		yazi_body=[
-			f'Type "/{FIRST_FILE_NAME}" Enter',
-			SLEEP_TIME,
-			'Type "tt"',
-			SLEEP_TIME,
-			'Type "j"',
-			SLEEP_TIME,
-			'Type "tt"',
-			SLEEP_TIME,
-			'Type "gg"',
-			SLEEP_TIME,
-			'Type "tt"',
-			SLEEP_TIME,
-			'Type "tt"',
-			SLEEP_TIME,
-			'Type "h"',
-			SLEEP_TIME,
-			'Type "j"',
-			SLEEP_TIME,
-			'Type "tt"',
-			SLEEP_TIME,
-			'Type "tt"',
-		],
-	),
-	VHSTape(
-		name="Smart tab switch",
-		scripts=[
-			VHSTape.edit_plugin_config("smart_tab_switch", True),
-			VHSTape.create_tab_switch_keymap_toml(),
-		],
-		yazi_body=[
-			'Type "l"',
-			SLEEP_TIME,
-			'Type "2"',
-			SLEEP_TIME,
-			'Type "]"',
-			SLEEP_TIME,
-			'Type "h"',
-			SLEEP_TIME,
-			VHSTape.press_key_repeatedly("]", 4),
-			SLEEP_TIME,
-			'Type "8"',
-			SLEEP_TIME,
-			VHSTape.press_key_repeatedly("]", 17),
-		],
-	),
-	VHSTape(
-		name="Quit with confirmation",
-		skip_quitting_yazi=True,
-		scripts=[
-			VHSTape.create_keymap_toml_with_keymap({"q": "quit"}),
-		],
-		yazi_body=[
-			SLEEP_TIME,
-			'Type "q"',
-			'Type "yazi" Enter',
-			SLEEP_TIME,
-			'Type "tt"',
-			SLEEP_TIME,
-			'Type "q"',
-			SLEEP_TIME,
-			'Type "n"',
-			SLEEP_TIME,
-			'Type "q"',
-			SLEEP_TIME,
-			'Type "y"',
-			SLEEP_TIME,
-		],
-	),
-	VHSTape(
-		name="Smooth arrow",
-		scripts=[
-			VHSTape.edit_plugin_config("wraparound_file_navigation", False),
-			VHSTape.edit_plugin_config("smooth_scrolling", True),
-			VHSTape.create_keymap_toml_with_keymap(
-				{
-					"j": "arrow -- 10",
-					"k": "arrow -- -10",
-				}
-			),
-		],
-		yazi_body=[
-			"Type 'j'",
-			SLEEP_TIME,
-			"Type 'j'",
-			SLEEP_TIME,
-			"Type 'k'",
-			SLEEP_TIME,
-			"Type 'k'",
-			SLEEP_TIME,
-			"Type 'j'",
-			"Type 'j'",
-			SLEEP_TIME,
-			"Type 'k'",
-			"Type 'k'",
-		],
-	),
-	VHSTape(
-		name="Wraparound arrow",
-		yazi_body=[
-			VHSTape.press_key_repeatedly("j", 20),
-			SLEEP_TIME,
-			VHSTape.press_key_repeatedly("k", 20),
-		],
-	),
-	VHSTape(
-		name="Smooth wraparound arrow",
-		scripts=[
-			VHSTape.edit_plugin_config("smooth_scrolling", True),
-			VHSTape.create_keymap_toml_with_keymap(
-				{
-					"d": "arrow -- 10",
-					"u": "arrow -- -10",
-				}
-			),
-		],
-		yazi_body=[
-			VHSTape.press_key_repeatedly("j", 5),
-			SLEEP_TIME,
-			"Type 'u'",
-			SLEEP_TIME,
-			"Type 'u'",
-			SLEEP_TIME,
-			"Type 'G'",
-			SLEEP_TIME,
-			VHSTape.press_key_repeatedly("k", 5),
-			SLEEP_TIME,
-			"Type 'd'",
-			SLEEP_TIME,
-			"Type 'd'",
-		],
-	),
-	VHSTape(
-		name="Parent arrow",
-		scripts=[
-			VHSTape.edit_plugin_config("wraparound_file_navigation", False),
-		],
-		yazi_body=[
-			'Type "l"',
-			SHORT_SLEEP_TIME,
-			'Type "l"',
-			SLEEP_TIME,
-			VHSTape.press_key_repeatedly("J", 4),
-			SLEEP_TIME,
-			VHSTape.press_key_repeatedly("K", 4),
-			SLEEP_TIME,
-			VHSTape.press_key_repeatedly("J", 4),
-			SLEEP_TIME,
-			VHSTape.press_key_repeatedly("K", 4),
-		],
-	),
-	VHSTape(
-		name="Smooth parent arrow",
-		scripts=[
-			VHSTape.edit_plugin_config("wraparound_file_navigation", False),
-			VHSTape.edit_plugin_config("smooth_scrolling", True),
-			VHSTape.create_keymap_toml_with_keymap(
-				{
-					"J": "parent-arrow -- 5",
-					"K": "parent-arrow -- -5",
-				}
-			),
-		],
-		yazi_body=[
-			"Type 'l'",
-			SLEEP_TIME,
-			"Type 'J'",
-			SLEEP_TIME,
-			"Type 'K'",
-			SLEEP_TIME,
-			"Type 'J'",
-			SLEEP_TIME,
-			"Type 'K'",
-			SLEEP_TIME,
-			"Type 'J'",
-			"Type 'K'",
-			SLEEP_TIME,
-			"Type 'J'",
-			"Type 'K'",
-		],
-	),
-	VHSTape(
-		name="Wraparound parent arrow",
-		yazi_body=[
-			'Type "l"',
-			SHORT_SLEEP_TIME,
-			'Type "l"',
-			SLEEP_TIME,
-			VHSTape.press_key_repeatedly("J", 20),
-			SLEEP_TIME,
-			VHSTape.press_key_repeatedly("K", 20),
-		],
-	),
-	VHSTape(
-		name="Smooth wraparound parent arrow",
-		scripts=[
-			VHSTape.edit_plugin_config("smooth_scrolling", True),
-			VHSTape.create_keymap_toml_with_keymap(
-				{
-					"J": "parent-arrow -- 1",
-					"K": "parent-arrow -- -1",
-					"d": "parent-arrow -- 5",
-					"u": "parent-arrow -- -5",
-				}
-			),
-		],
-		yazi_body=[
-			"Type 'l'",
-			SLEEP_TIME,
-			VHSTape.press_key_repeatedly("J", 5),
-			SLEEP_TIME,
-			"Type 'u'",
-			SLEEP_TIME,
-			"Type 'u'",
-			SLEEP_TIME,
-			"Type 'h'",
-			SLEEP_TIME,
-			f'Type "/{FIRST_FILE_NAME}" Enter',
-			SLEEP_TIME,
-			"Type 'k'",
-			SLEEP_TIME,
-			"Type 'l'",
-			SLEEP_TIME,
-			VHSTape.press_key_repeatedly("K", 5),
-			SLEEP_TIME,
-			"Type 'd'",
-			SLEEP_TIME,
-			"Type 'd'",
-		],
-	),
-	VHSTape(
-		name="First file",
-		yazi_body=[
-			"Type 'gf'",
-			SLEEP_TIME,
-			"Type 'gg'",
-			SLEEP_TIME,
-			"Type 'gf'",
-			SLEEP_TIME,
-			"Type 'G'",
-			SLEEP_TIME,
-			"Type 'gf'",
-		],
-	),
-	VHSTape(
-		name="Smooth first file",
-		scripts=[
-			VHSTape.edit_plugin_config("smooth_scrolling", True),
-		],
-		yazi_body=[
-			"Type 'gf'",
-			SLEEP_TIME,
-			"Type 'gg'",
-			SLEEP_TIME,
-			"Type 'gf'",
-			SLEEP_TIME,
-			"Type 'G'",
-			SLEEP_TIME,
-			"Type 'gf'",
-		],
-	),
-	VHSTape(
-		name="Archive must have hovered item",
-		files_and_directories=["demo.zip"],
-		scripts=[
-			VHSTape.edit_plugin_config("reveal_created_archive", False),
-			VHSTape.create_keymap_toml_with_keymap({DEFAULT_KEY: "archive"}),
-		],
-		yazi_body=[
-			f'Type "/{FIRST_FILE_NAME}" Enter',
-			SLEEP_TIME,
-			'Type "j"',
-			"Space@300ms 3",
-			SLEEP_TIME,
-			f'Type "/{EMPTY_FOLDER}" Enter',
-			SLEEP_TIME,
-			'Type "l"',
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			LONG_SLEEP_TIME,
-			'Type "h"',
-			SLEEP_TIME,
-			f'Type "/{FIRST_FILE_NAME}" Enter',
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			SLEEP_TIME,
-			'Type "{0}" Enter',
-			SLEEP_TIME,
-			'Type "gg"',
-			SLEEP_TIME,
-			'Type "/{0}" Enter',
-		],
-	),
-	VHSTape(
-		name="Archive hovered item optional",
-		files_and_directories=["demo.zip", "**/demo.zip"],
-		scripts=[
-			VHSTape.edit_plugin_config("must_have_hovered_item", False),
-			VHSTape.edit_plugin_config("reveal_created_archive", False),
-			VHSTape.create_keymap_toml_with_keymap({DEFAULT_KEY: "archive"}),
-		],
-		yazi_body=[
-			f'Type "/{FIRST_FILE_NAME}" Enter',
-			SLEEP_TIME,
-			'Type "j"',
-			"Space@300ms 3",
-			SLEEP_TIME,
-			f'Type "/{EMPTY_FOLDER}" Enter',
-			SLEEP_TIME,
-			'Type "l"',
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			SLEEP_TIME,
-			'Type "{0}" Enter',
-			SLEEP_TIME,
-			'Type "/{0}" Enter',
-			SLEEP_TIME,
-			'Type "h"',
-			SLEEP_TIME,
-			f'Type "/{FIRST_FILE_NAME}" Enter',
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			SLEEP_TIME,
-			'Type "{0}" Enter',
-			SLEEP_TIME,
-			'Type "/{0}" Enter',
-		],
-	),
-	VHSTape(
-		name="Archive prompt",
-		files_and_directories=[
-			"demo.zip",
-			"demo-1.zip",
-			"demo-2.zip",
-		],
-		scripts=[
-			VHSTape.edit_plugin_config("prompt", True),
-			VHSTape.edit_plugin_config("reveal_created_archive", False),
-			VHSTape.create_keymap_toml_with_keymap({DEFAULT_KEY: "archive"}),
-		],
-		yazi_body=[
-			f'Type "/{FIRST_FILE_NAME}" Enter',
-			SLEEP_TIME,
-			'Type "j"',
-			"Space@300ms 3",
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			SLEEP_TIME,
-			'Type "h" Enter',
-			SLEEP_TIME,
-			'Type "{0}" Enter',
-			SLEEP_TIME,
-			'Type "gg"',
-			SLEEP_TIME,
-			'Type "/{0}" Enter',
-			SLEEP_TIME,
-			f'Type "/{FIRST_FILE_NAME}" Enter',
-			'Type "jjjj"',
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			SLEEP_TIME,
-			'Type "s" Enter',
-			SLEEP_TIME,
-			'Type "{1}" Enter',
-			SLEEP_TIME,
-			'Type "gg"',
-			SLEEP_TIME,
-			'Type "/{1}" Enter',
-			SLEEP_TIME,
-			f'Type "/{FIRST_FILE_NAME}" Enter',
-			'Type "jjjj"',
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			SLEEP_TIME,
-			"Enter",
-			SLEEP_TIME,
-			'Type "{2}" Enter',
-			SLEEP_TIME,
-			'Type "gg"',
-			SLEEP_TIME,
-			'Type "/{2}" Enter',
-		],
-	),
-	VHSTape(
-		name="Archive behaviour",
-		files_and_directories=[
-			"demo.zip",
-			"demo-1.zip",
-			"demo.txt",
-			"demo.txt.zip",
-			"demo-2",
-			"demo-2.zip",
-			"archive_to_overwrite.zip",
-		],
-		scripts=[
-			VHSTape.edit_plugin_config("reveal_created_archive", False),
-			VHSTape.create_keymap_toml_with_keymap({DEFAULT_KEY: "archive"}),
-			VHSTape.create_nested_archive(4, "{6}"),
-			Script(
-				setup=[
-					f"Type `echo '{DEFAULT_TEXT_FILE_CONTENT}' > "
-					+ "{2}` Enter"
-				],
-				required_programs=["echo"],
-			),
-		],
-		yazi_body=[
-			f'Type "/{FIRST_FILE_NAME}" Enter',
-			SLEEP_TIME,
-			'Type "j"',
-			"Space@300ms 3",
-			'Type "k"',
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			SLEEP_TIME,
-			'Type "{0}" Enter',
-			SLEEP_TIME,
-			'Type "gg"',
-			SLEEP_TIME,
-			'Type "/{0}" Enter',
-			SLEEP_TIME,
-			f'Type "/{FIRST_FILE_NAME}" Enter',
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			SLEEP_TIME,
-			'Type "{1}" Enter',
-			SLEEP_TIME,
-			'Type "gg"',
-			SLEEP_TIME,
-			'Type "/{1}" Enter',
-			SLEEP_TIME,
-			'Type "/{2}" Enter',
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			SLEEP_TIME,
-			"Enter",
-			SLEEP_TIME,
-			'Type "gg"',
-			SLEEP_TIME,
-			'Type "/{3}" Enter',
-			SLEEP_TIME,
-			f'Type "/{FIRST_FILE_NAME}" Enter',
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			SLEEP_TIME,
-			'Type "{4}" Enter',
-			SLEEP_TIME,
-			'Type "/{5}" Enter',
-			SLEEP_TIME,
-			f'Type "/{FIRST_FILE_NAME}" Enter',
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			SLEEP_TIME,
-			'Type "{6}" Enter',
-			SLEEP_TIME,
-			"Ctrl+c",
-			SLEEP_TIME,
-			'Type "/{6}" Enter',
-		],
-	),
-	VHSTape(
-		name="Archive encrypt files",
-		files_and_directories=["demo.7z"],
-		scripts=[
-			VHSTape.edit_plugin_config("reveal_created_archive", False),
-			VHSTape.create_keymap_toml_with_keymap(
-				{DEFAULT_KEY: "archive -- --encrypt --encrypt-headers"}
-			),
-		],
-		yazi_body=[
-			f'Type "/{FIRST_FILE_NAME}" Enter',
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			SLEEP_TIME,
-			'Type "{0}" Enter',
-			SLEEP_TIME,
-			'Type "{0}" Enter',
-			SLEEP_TIME,
-			'Type "{0}" Enter',
-			SLEEP_TIME,
-			'Type "/{0}" Enter',
-		],
-	),
-	VHSTape(
-		name="Archive reveal created archive",
-		files_and_directories=["demo.zip"],
-		scripts=[
-			VHSTape.create_keymap_toml_with_keymap({DEFAULT_KEY: "archive"}),
-		],
-		yazi_body=[
-			f'Type "/{FIRST_FILE_NAME}" Enter',
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			SLEEP_TIME,
-			'Type "{0}" Enter',
-		],
-	),
-	VHSTape(
-		name="Archive remove archived files",
-		files_and_directories=[
-			"demo.zip",
-			"demo-1.txt",
-			"demo-2.txt",
-			"demo-3.txt",
-			"demo-4.txt",
-			"demo-5.txt",
-		],
-		scripts=[
-			VHSTape.edit_plugin_config("reveal_created_archive", False),
-			VHSTape.create_keymap_toml_with_keymap(
-				{DEFAULT_KEY: "archive -- --remove"}
-			),
-			Script(
-				setup=[
-					f"Type `echo '{DEFAULT_TEXT_FILE_CONTENT}' > "
-					+ "{"
-					+ str(i)
-					+ "}` Enter"
-					for i in range(1, 6)
-				],
-				required_programs=["echo"],
-			),
-		],
-		yazi_body=[
-			'Type "/{1}" Enter',
-			SLEEP_TIME,
-			"Space@300ms 5",
-			'Type "k"',
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			SLEEP_TIME,
-			'Type "{0}" Enter',
-			SLEEP_TIME,
-			'Type "/{1}" Enter',
-		],
-	),
-	VHSTape(
-		name="Archive remove protected archived files",
-		files_and_directories=[
-			os.path.join(PROTECTED_FOLDER, "demo.zip"),
-			os.path.join(PROTECTED_FOLDER, "demo-1.txt"),
-			os.path.join(PROTECTED_FOLDER, "demo-2.txt"),
-			os.path.join(PROTECTED_FOLDER, "demo-3.txt"),
-			os.path.join(PROTECTED_FOLDER, "demo-4.txt"),
-			os.path.join(PROTECTED_FOLDER, "demo-5.txt"),
-			"demo.zip",
-			"demo-1.txt",
-		],
-		scripts=[
-			VHSTape.edit_plugin_config(
-				"protected_directories",
-				"".join(
-					[
-						r'{{"',
-						str(PROTECTED_DIRECTORY.absolute()),
-						r'"}}',
-					]
+				VHSTape.create_multiple_nested_archives(4, 4),
+			],
+			yazi_body=[
+				'Type "/{0}" Enter',
+				SLEEP_TIME,
+				'Type "j"',
+				"Space@300ms 3",
+				SLEEP_TIME,
+				f'Type "/{EMPTY_FOLDER}" Enter',
+				SLEEP_TIME,
+				'Type "l"',
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				LONG_SLEEP_TIME,
+				'Type "h"',
+				SLEEP_TIME,
+				'Type "/{0}" Enter',
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				SLEEP_TIME,
+				'Type "gg"',
+				SLEEP_TIME,
+				'Type "/{4}" Enter',
+			],
+		),
+		VHSTape(
+			name="Extract hovered item optional",
+			files_and_directories=[
+				"demo-1.zip",
+				"demo-2.zip",
+				"demo-3.zip",
+				"demo-4.zip",
+				"demo-2",
+				"demo-3",
+				"demo-4",
+				"demo-1",
+			],
+			scripts=[
+				VHSTape.edit_plugin_config(
+					"recursively_extract_archives", False
 				),
-				r"{{}}",
-			),
-			VHSTape.edit_plugin_config("reveal_created_archive", False),
-			VHSTape.create_keymap_toml_with_keymap(
-				{DEFAULT_KEY: "archive -- --remove"}
-			),
-			Script(
-				setup=[
-					f"Type `echo '{DEFAULT_TEXT_FILE_CONTENT}' > "
-					+ "{"
-					+ str(i)
-					+ "}` Enter"
-					for i in range(1, 6)
-				],
-				required_programs=["echo"],
-			),
-		],
-		yazi_body=[
-			f'Type "/{PROTECTED_FOLDER}" Enter',
-			SLEEP_TIME,
-			'Type "l"',
-			SLEEP_TIME,
-			'Type "/{7}" Enter',
-			SLEEP_TIME,
-			"Space@300ms 5",
-			'Type "k"',
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			SLEEP_TIME,
-			'Type "{6}" Enter',
-			SLEEP_TIME,
-			"Ctrl+c",
-			SLEEP_TIME,
-			'Type "/{6}" Enter',
-		],
-	),
-	VHSTape(
-		name="Emit Yazi command",
-		scripts=[VHSTape.create_keymap_toml_with_keymap({DEFAULT_KEY: "emit"})],
-		yazi_body=[
-			f'Type "{DEFAULT_KEY}"',
-			SLEEP_TIME,
-			'Type "arrow next" Enter',
-		],
-	),
-	VHSTape(
-		name="Emit plugin command",
-		scripts=[
-			VHSTape.create_keymap_toml_with_keymap(
-				{DEFAULT_KEY: "emit -- --plugin"}
-			)
-		],
-		yazi_body=[
-			'Type "l"',
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			SLEEP_TIME,
-			'Type "augment-command.parent-arrow -- 1" Enter',
-		],
-	),
-	VHSTape(
-		name="Emit augmented command",
-		scripts=[
-			VHSTape.create_keymap_toml_with_keymap(
-				{DEFAULT_KEY: "emit -- --augmented"}
-			)
-		],
-		yazi_body=[
-			'Type "l"',
-			SLEEP_TIME,
-			f'Type "{DEFAULT_KEY}"',
-			SLEEP_TIME,
-			'Type "parent-arrow 1" Enter',
-		],
-	),
-	VHSTape(
-		name="Editor must have hovered item",
-		editor="emacs -nw",
-		yazi_body=[
-			f'Type "/{FIRST_FILE_NAME}" Enter',
-			SLEEP_TIME,
-			'Type "j"',
-			"Space@300ms 3",
-			SLEEP_TIME,
-			f'Type "/{EMPTY_FOLDER}" Enter',
-			SLEEP_TIME,
-			'Type "l"',
-			'Type "o"',
-			LONG_SLEEP_TIME,
-			'Type "h"',
-			SLEEP_TIME,
-			f'Type "/{FIRST_FILE_NAME}" Enter',
-			SLEEP_TIME,
-			#
-			# Open the editor
-			'Type "o"',
-			VERY_LONG_SLEEP_TIME,
-			'Type ":qa!" Enter',
-		],
-	),
-	VHSTape(
-		name="Editor hovered item optional",
-		editor="emacs -nw",
-		scripts=[
-			VHSTape.edit_plugin_config("must_have_hovered_item", False),
-		],
-		yazi_body=[
-			f'Type "/{FIRST_FILE_NAME}" Enter',
-			SLEEP_TIME,
-			'Type "j"',
-			"Space@300ms 3",
-			SLEEP_TIME,
-			f'Type "/{EMPTY_FOLDER}" Enter',
-			SLEEP_TIME,
-			'Type "l"',
-			SLEEP_TIME,
-			#
-			# Open the editor
-			'Type "o"',
-			VERY_LONG_SLEEP_TIME,
-			'Type ":qa!" Enter',
-			SLEEP_TIME,
-			'Type "h"',
-			SLEEP_TIME,
-			f'Type "/{FIRST_FILE_NAME}" Enter',
-			SLEEP_TIME,
-			#
-			# Open the editor
-			'Type "o"',
-			VERY_LONG_SLEEP_TIME,
-			'Type ":qa!" Enter',
-		],
-	),
-	VHSTape(
-		name="Editor prompt",
-		editor="emacs -nw",
-		scripts=[
-			VHSTape.edit_plugin_config("prompt", True),
-		],
-		yazi_body=[
-			f'Type "/{FIRST_FILE_NAME}" Enter',
-			"Space@300ms 3",
-			'Type "o"',
-			SLEEP_TIME,
-			'Type "h"',
-			SLEEP_TIME,
-			"Enter",
-			#
-			# Waiting for the editor to open
-			VERY_LONG_SLEEP_TIME,
-			'Type ":qa!" Enter',
-			SLEEP_TIME,
-			'Type "o"',
-			SLEEP_TIME,
-			'Type "s"',
-			SLEEP_TIME,
-			"Enter",
-			#
-			# Waiting for the editor to open
-			VERY_LONG_SLEEP_TIME,
-			'Type ":qa!" Enter',
-			SLEEP_TIME,
-			'Type "o"',
-			SLEEP_TIME,
-			"Enter",
-			#
-			# Waiting for the editor to open
-			VERY_LONG_SLEEP_TIME,
-			'Type ":qa!" Enter',
-		],
-	),
-	VHSTape(
-		name="Editor behaviour",
-		editor="emacs -nw",
-		yazi_body=[
-			f'Type "/{FIRST_FILE_NAME}" Enter',
-			"Space@300ms 3",
-			SLEEP_TIME,
-			#
-			# Open the editor
-			'Type "o"',
-			VERY_LONG_SLEEP_TIME,
-			'Type ":qa!" Enter',
-			SLEEP_TIME,
-			'Type "j"',
-			SLEEP_TIME,
-			#
-			# Open the editor
-			'Type "o"',
-			VERY_LONG_SLEEP_TIME,
-			'Type ":qa!" Enter',
-			SLEEP_TIME,
-			'Type "kk"',
-			SLEEP_TIME,
-			#
-			# Open the editor
-			'Type "o"',
-			VERY_LONG_SLEEP_TIME,
-			'Type ":qa!" Enter',
-		],
-	),
-	VHSTape(
-		name="Pager must have hovered item",
-		yazi_body=[
-			f'Type "/{FIRST_FILE_NAME}" Enter',
-			SLEEP_TIME,
-			'Type "j"',
-			"Space@300ms 3",
-			SLEEP_TIME,
-			f'Type "/{EMPTY_FOLDER}" Enter',
-			SLEEP_TIME,
-			'Type "l"',
-			'Type "i"',
-			LONG_SLEEP_TIME,
-			'Type "h"',
-			SLEEP_TIME,
-			f'Type "/{FIRST_FILE_NAME}" Enter',
-			SLEEP_TIME,
-			'Type "i"',
-			SLEEP_TIME,
-			'Type "q"',
-		],
-	),
-	VHSTape(
-		name="Pager hovered item optional",
-		scripts=[
-			VHSTape.edit_plugin_config("must_have_hovered_item", False),
-		],
-		yazi_body=[
-			f'Type "/{FIRST_FILE_NAME}" Enter',
-			SLEEP_TIME,
-			'Type "j"',
-			"Space@300ms 3",
-			SLEEP_TIME,
-			f'Type "/{EMPTY_FOLDER}" Enter',
-			SLEEP_TIME,
-			'Type "l"',
-			SLEEP_TIME,
-			'Type "i"',
-			SLEEP_TIME,
-			'Type ":n"',
-			SLEEP_TIME,
-			'Type ":n"',
-			SLEEP_TIME,
-			'Type ":n"',
-			SLEEP_TIME,
-			'Type "q"',
-			SLEEP_TIME,
-			'Type "h"',
-			SLEEP_TIME,
-			f'Type "/{FIRST_FILE_NAME}" Enter',
-			SLEEP_TIME,
-			'Type "i"',
-			SLEEP_TIME,
-			'Type "q"',
-		],
-	),
-	VHSTape(
-		name="Pager prompt",
-		scripts=[
-			VHSTape.edit_plugin_config("prompt", True),
-		],
-		yazi_body=[
-			f'Type "/{FIRST_FILE_NAME}" Enter',
-			"Space@300ms 3",
-			'Type "i"',
-			SLEEP_TIME,
-			'Type "h"',
-			SLEEP_TIME,
-			"Enter",
-			SLEEP_TIME,
-			'Type "q"',
-			SLEEP_TIME,
-			'Type "i"',
-			SLEEP_TIME,
-			'Type "s"',
-			SLEEP_TIME,
-			"Enter",
-			SLEEP_TIME,
-			'Type ":n"',
-			SLEEP_TIME,
-			'Type ":n"',
-			SLEEP_TIME,
-			'Type ":n"',
-			SLEEP_TIME,
-			'Type "q"',
-			SLEEP_TIME,
-			'Type "i"',
-			SLEEP_TIME,
-			"Enter",
-			SLEEP_TIME,
-			'Type "q"',
-		],
-	),
-	VHSTape(
-		name="Pager behaviour",
-		yazi_body=[
-			f'Type "/{FIRST_FILE_NAME}" Enter',
-			"Space@300ms 3",
-			SLEEP_TIME,
-			'Type "i"',
-			SLEEP_TIME,
-			'Type "q"',
-			SLEEP_TIME,
-			'Type "j"',
-			SLEEP_TIME,
-			'Type "i"',
-			SLEEP_TIME,
-			'Type "q"',
-			SLEEP_TIME,
-			'Type "kk"',
-			SLEEP_TIME,
-			'Type "i"',
-			SLEEP_TIME,
-			'Type ":n"',
-			SLEEP_TIME,
-			'Type ":n"',
-			SLEEP_TIME,
-			'Type ":n"',
-			SLEEP_TIME,
-			'Type "q"',
-			SLEEP_TIME,
-			'Type "gg"',
-			"Space@300ms 2",
-			'Type "k"',
-			SLEEP_TIME,
-			'Type "i"',
-			SLEEP_TIME,
-			"Enter",
-			SLEEP_TIME,
-			'Type ":n"',
-			SLEEP_TIME,
-			'Type ":n"',
-			SLEEP_TIME,
-			'Type ":n"',
-			SLEEP_TIME,
-			'Type "q"',
-			SLEEP_TIME,
-			"Escape 2",
-			'Type "gg"',
-			SLEEP_TIME,
-			'Type "u"',
-			SLEEP_TIME,
-			'Type "i"',
-			SLEEP_TIME,
-			'Type "j"',
-			SLEEP_TIME,
-			'Type "i"',
-			SLEEP_TIME,
-			'Type "gg"',
-			"Space@300ms 2",
-			'Type "k"',
-			SLEEP_TIME,
-			'Type "i"',
-		],
-	),
-]
-
-
-async def main():
-	"Main function to run to generate the VHS tapes"
-
-	# Get the arguments to the script
-	args = get_command_line_arguments()
-
-	# Create the demonstration directory if it does not exist
-	if not os.path.isdir(DEMONSTRATION_DIRECTORY):
-		os.mkdir(DEMONSTRATION_DIRECTORY)
-
-	# Change directory to the demonstration directory
-	os.chdir(DEMONSTRATION_DIRECTORY)
-
-	# Create the VHS tapes directory if it doesn't exist
-	if not os.path.isdir(VHS_TAPES_DIRECTORY):
-		os.mkdir(VHS_TAPES_DIRECTORY)
-
-	# Create the files and folders for the demonstration
-	for folder in [EMPTY_FOLDER, PROTECTED_FOLDER, "."] + [
-		f"folder-{number}" for number in range(1, 4)
-	]:
-		#
-
-		# If the folder is the VHS tapes directory, or the empty folder
-		if folder in [VHS_TAPES_DIRECTORY, EMPTY_FOLDER]:
-			#
-
-			# Create the folder
-			os.mkdir(folder)
-
-			# Continue the loop
-			continue
-
-		# Create an inner folder
-		Path(f"{folder}/inner-folder/").mkdir(parents=True)
-
-		# Iterate over the files for the folder
-		for file_number in range(1, 11):
-			#
-
-			# Create the file with the demonstration text
-			Path(f"{folder}/file-{file_number}.txt").write_text(
-				DEMONSTRATION_TEXT
-			)
-
-	# The path to the file in the folder with subdirectory
-	file_in_folder_with_subdirectory = Path(
-		f"./{FOLDER_WITH_SUBDIRECTORY}/subdirectory/hi-there.txt"
-	)
-
-	# Create the folder with the subdirectory
-	file_in_folder_with_subdirectory.parent.mkdir(parents=True)
-
-	# Write to the file in the folder with subdirectory
-	file_in_folder_with_subdirectory.write_text("Skipped!")
-
-	# Get the current theme
-	darkman_result = subprocess.run(["darkman", "get"], capture_output=True)
-
-	# Get the theme from the stdout
-	initial_theme = darkman_result.stdout.decode("utf-8").strip()
-
-	# Get if the theme is light
-	is_light_theme = initial_theme == "light"
-
-	# If the theme is light, change the theme to dark
-	if is_light_theme:
-		subprocess.run(["darkman", "set", "dark"])
-
-	# Initialise the list of threads
-	threads: list[Coroutine[None, None, None]] = []
-
-	# Initialise the list of vhs tapes
-	vhs_tapes = VHS_TAPES
-
-	# If a search term is given,
-	# then get only the vhs tapes
-	# that contain the search terms
-	if (search_term := cast(str | None, args.search_term)) is not None:
-		vhs_tapes = list(
-			filter(
-				lambda tape: all(
-					term in tape.name.lower()
-					for term in search_term.lower().split()
+				VHSTape.edit_plugin_config("must_have_hovered_item", False),
+				VHSTape.create_keymap_toml_with_keymap(
+					{DEFAULT_KEY: "extract"}
 				),
-				vhs_tapes,
-			)
-		)
-
-	# Create the VHS tapes
-	for vhs_tape in vhs_tapes:
-		threads.append(asyncio.to_thread(vhs_tape.write_to_file))
-
-	# Wait for all the threads to complete
-	await asyncio.gather(*threads)
-
-	# Iterate over the VHS tapes
-	for vhs_tape in vhs_tapes:
-		#
-
-		# Get the file path for the VHS tape
-		file_path = vhs_tape.get_file_path()
-
-		# Create the video for the VHS tape
-		subprocess.run(["vhs", file_path], check=True)
+				VHSTape.create_multiple_nested_archives(4, 4),
+			],
+			yazi_body=[
+				'Type "/{0}" Enter',
+				SLEEP_TIME,
+				'Type "j"',
+				"Space@300ms 3",
+				SLEEP_TIME,
+				f'Type "/{EMPTY_FOLDER}" Enter',
+				SLEEP_TIME,
+				'Type "l"',
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				SLEEP_TIME,
+				'Type "h"',
+				SLEEP_TIME,
+				'Type "gg"',
+				SLEEP_TIME,
+				'Type "/{4}" Enter',
+				SLEEP_TIME,
+				'Type "j"',
+				SLEEP_TIME,
+				'Type "j"',
+				SLEEP_TIME,
+				'Type "/{0}" Enter',
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				SLEEP_TIME,
+				'Type "gg"',
+				SLEEP_TIME,
+				'Type "/{7}" Enter',
+			],
+		),
+		VHSTape(
+			name="Extract prompt",
+			files_and_directories=[
+				"demo-1.zip",
+				"demo-2.zip",
+				"demo-3.zip",
+				"demo-4.zip",
+				"demo-1",
+				"demo-4",
+				"demo-4_1",
+			],
+			scripts=[
+				VHSTape.edit_plugin_config(
+					"recursively_extract_archives", False
+				),
+				VHSTape.edit_plugin_config("prompt", True),
+				VHSTape.create_keymap_toml_with_keymap(
+					{DEFAULT_KEY: "extract"}
+				),
+				VHSTape.create_multiple_nested_archives(4, 4),
+			],
+			yazi_body=[
+				'Type "/{0}" Enter',
+				SLEEP_TIME,
+				"Space@300ms 3",
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				SLEEP_TIME,
+				'Type "h"',
+				SLEEP_TIME,
+				"Enter",
+				SLEEP_TIME,
+				'Type "gg"',
+				SLEEP_TIME,
+				'Type "/{5}" Enter',
+				SLEEP_TIME,
+				'Type "/{3}" Enter',
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				SLEEP_TIME,
+				'Type "s"',
+				SLEEP_TIME,
+				"Enter",
+				SLEEP_TIME,
+				'Type "gg"',
+				SLEEP_TIME,
+				'Type "/{4}" Enter',
+				SLEEP_TIME,
+				'Type "j"',
+				SLEEP_TIME,
+				'Type "j"',
+				SLEEP_TIME,
+				'Type "/{3}" Enter',
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				SLEEP_TIME,
+				"Enter",
+				SLEEP_TIME,
+				'Type "gg"',
+				SLEEP_TIME,
+				'Type "/{6}" Enter',
+			],
+		),
+		VHSTape(
+			name="Extract behaviour",
+			files_and_directories=[
+				"demo-1.zip",
+				"demo-2.zip",
+				"demo-3.zip",
+				"demo-4.zip",
+				"demo-5.zip",
+				"demo-4",
+				"demo-1",
+			],
+			scripts=[
+				VHSTape.edit_plugin_config(
+					"recursively_extract_archives", False
+				),
+				VHSTape.create_keymap_toml_with_keymap(
+					{DEFAULT_KEY: "extract"}
+				),
+				VHSTape.create_multiple_nested_archives(5, 4),
+			],
+			yazi_body=[
+				'Type "/{0}" Enter',
+				SLEEP_TIME,
+				"Space@300ms 3",
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				SLEEP_TIME,
+				'Type "gg"',
+				SLEEP_TIME,
+				'Type "/{5}" Enter',
+				SLEEP_TIME,
+				'Type "/{0}" Enter',
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				SLEEP_TIME,
+				'Type "gg"',
+				SLEEP_TIME,
+				'Type "/{6}" Enter',
+				SLEEP_TIME,
+				'Type "j"',
+				SLEEP_TIME,
+				'Type "j"',
+			],
+		),
+		VHSTape(
+			name="Extract recursively extract archives",
+			files_and_directories=["demo.zip", "demo"],
+			scripts=[
+				VHSTape.create_keymap_toml_with_keymap(
+					{DEFAULT_KEY: "extract"}
+				),
+				VHSTape.create_nested_archive(4, "{0}"),
+			],
+			shell_body=[
+				"Type `7z l {0}` Enter",
+				LONG_SLEEP_TIME,
+			],
+			yazi_body=[
+				'Type "/{0}" Enter',
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				SLEEP_TIME,
+				'Type "gg"',
+				SLEEP_TIME,
+				'Type "/{1}" Enter',
+				SLEEP_TIME,
+				'Type "l"',
+			],
+		),
+		VHSTape(
+			name="Extract encrypted archive",
+			files_and_directories=["demo.7z", "demo.txt"],
+			scripts=[
+				VHSTape.create_keymap_toml_with_keymap(
+					{DEFAULT_KEY: "extract"}
+				),
+				VHSTape.create_encrypted_archive(
+					archive_file_name="{0}",
+					archive_password="{0}",
+				),
+			],
+			yazi_body=[
+				'Type "/{0}" Enter',
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				SLEEP_TIME,
+				'Type "password" Enter',
+				SLEEP_TIME,
+				'Type "wrong password" Enter',
+				SLEEP_TIME,
+				'Type "still wrong password" Enter',
+				SLEEP_TIME,
+				'Type "LET ME IN!1!1!1!" Enter',
+				SLEEP_TIME,
+				'Type "w"',
+				SLEEP_TIME,
+				"Enter",
+				SLEEP_TIME,
+				'Type "q"',
+				SLEEP_TIME,
+				'Type "x"',
+				SLEEP_TIME,
+				"Ctrl+c",
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				SLEEP_TIME,
+				'Type "{0}" Enter',
+				SLEEP_TIME,
+				'Type "/{1}" Enter',
+			],
+		),
+		VHSTape(
+			name="Extract reveal extracted item",
+			files_and_directories=[
+				"demo.zip",
+				"demo",
+				"demo_1",
+				"demo_2",
+			],
+			scripts=[
+				VHSTape.create_keymap_toml_with_keymap(
+					{DEFAULT_KEY: "extract -- --reveal"}
+				),
+				VHSTape.create_nested_archive(4, "{0}"),
+			],
+			yazi_body=[
+				'Type "/{0}" Enter',
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				SLEEP_TIME,
+				'Type "h"',
+				SLEEP_TIME,
+				'Type "n"',
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				SLEEP_TIME,
+				'Type "h"',
+				SLEEP_TIME,
+				'Type "n"',
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+			],
+		),
+		VHSTape(
+			name="Extract remove extracted archive",
+			files_and_directories=["demo.zip"],
+			scripts=[
+				VHSTape.create_keymap_toml_with_keymap(
+					{DEFAULT_KEY: "extract -- --remove"}
+				),
+				VHSTape.create_nested_archive(4, "{0}"),
+			],
+			yazi_body=[
+				'Type "/{0}" Enter',
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				SLEEP_TIME,
+				'Type "/{0}" Enter',
+			],
+		),
+		VHSTape(
+			name="Extract remove protected extracted archive",
+			files_and_directories=[
+				os.path.join(PROTECTED_FOLDER, "demo.zip"),
+				"demo.zip",
+			],
+			scripts=[
+				VHSTape.edit_plugin_config(
+					"protected_directories",
+					"".join(
+						[
+							r'{{"',
+							str(PROTECTED_DIRECTORY.absolute()),
+							r'"}}',
+						]
+					),
+					r"{{}}",
+				),
+				VHSTape.create_keymap_toml_with_keymap(
+					{DEFAULT_KEY: "extract -- --remove"}
+				),
+				VHSTape.create_nested_archive(4, "{0}"),
+			],
+			yazi_body=[
+				f'Type "/{PROTECTED_FOLDER}" Enter',
+				SLEEP_TIME,
+				'Type "l"',
+				SLEEP_TIME,
+				'Type "/{1}" Enter',
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				SLEEP_TIME,
+				"Ctrl+c",
+				SLEEP_TIME,
+				'Type "gg"',
+				SLEEP_TIME,
+				'Type "/{1}" Enter',
+			],
+		),
+		VHSTape(
+			name="Smart enter",
+			yazi_body=[
+				'Type "l"',
+				SLEEP_TIME,
+				'Type "h"',
+				SLEEP_TIME,
+				'Type "jl"',
+				SLEEP_TIME,
+				'Type "h"',
+				SLEEP_TIME,
+				'Type "jl"',
+				SLEEP_TIME,
+				'Type "h"',
+				SLEEP_TIME,
+				'Type "G"',
+				SLEEP_TIME,
+				'Type "l"',
+				SLEEP_TIME,
+				'Type ":q!" Enter',
+				SLEEP_TIME,
+				'Type "kl"',
+				SLEEP_TIME,
+				'Type ":q!" Enter',
+				SLEEP_TIME,
+				'Type "kl"',
+				SLEEP_TIME,
+				'Type ":q!" Enter',
+			],
+		),
+		VHSTape(
+			name="Enter skip single subdirectory",
+			yazi_body=[
+				f'Type "/{FOLDER_WITH_SUBDIRECTORY}" Enter',
+				SLEEP_TIME,
+				'Type "l"',
+				SLEEP_TIME,
+				"Left",
+				SLEEP_TIME,
+				"Left",
+			],
+		),
+		VHSTape(
+			name="Leave skip single subdirectory",
+			scripts=[
+				Script(
+					setup=f"Type `cd './{FOLDER_WITH_SUBDIRECTORY}/subdirectory/'`"
+					+ "Enter",
+				),
+			],
+			yazi_body=[
+				'Type "h"',
+				SLEEP_TIME,
+				f'Type "/{FOLDER_WITH_SUBDIRECTORY}" Enter',
+				"Right",
+				SLEEP_TIME,
+				"Right",
+			],
+		),
+		VHSTape(
+			name="Rename must have hovered item",
+			yazi_body=[
+				*SELECT_ITEMS_AND_ENTER_EMPTY_FOLDER_BODY,
+				SLEEP_TIME,
+				'Type "r"',
+				LONG_SLEEP_TIME,
+				'Type "h"',
+				SLEEP_TIME,
+				'Type "r"',
+				"Backspace@300ms 3",
+				SLEEP_TIME,
+				"Ctrl+c",
+			],
+		),
+		VHSTape(
+			name="Rename hovered item optional",
+			scripts=[
+				VHSTape.edit_plugin_config("must_have_hovered_item", False),
+			],
+			yazi_body=[
+				*SELECT_ITEMS_AND_ENTER_EMPTY_FOLDER_BODY,
+				SLEEP_TIME,
+				'Type "r"',
+				SLEEP_TIME,
+				'Type ":q!" Enter',
+				SLEEP_TIME,
+				'Type "h"',
+				SLEEP_TIME,
+				'Type "r"',
+				"Backspace@300ms 3",
+				SLEEP_TIME,
+				"Ctrl+c",
+			],
+		),
+		VHSTape(
+			name="Rename prompt",
+			scripts=[
+				VHSTape.edit_plugin_config("prompt", True),
+			],
+			yazi_body=[
+				f'Type "/{FIRST_FILE_NAME}" Enter',
+				"Space@300ms 3",
+				'Type "r"',
+				SLEEP_TIME,
+				'Type "h"',
+				SLEEP_TIME,
+				"Enter",
+				SLEEP_TIME,
+				"Escape",
+				'Type "b"',
+				SLEEP_TIME,
+				"Ctrl+c",
+				SLEEP_TIME,
+				'Type "r"',
+				SLEEP_TIME,
+				'Type "s"',
+				SLEEP_TIME,
+				"Enter",
+				SLEEP_TIME,
+				'Type ":q!" Enter',
+				SLEEP_TIME,
+				'Type "r"',
+				SLEEP_TIME,
+				"Enter",
+				SLEEP_TIME,
+				"Escape",
+				'Type "b"',
+				SLEEP_TIME,
+				"Ctrl+c",
+			],
+		),
+		VHSTape(
+			name="Rename behaviour",
+			yazi_body=[
+				f'Type "/{FIRST_FILE_NAME}" Enter',
+				"Space@300ms 3",
+				SLEEP_TIME,
+				'Type "r"',
+				SLEEP_TIME,
+				"Escape",
+				'Type "b"',
+				SLEEP_TIME,
+				"Ctrl+c",
+				SLEEP_TIME,
+				'Type "j"',
+				SLEEP_TIME,
+				'Type "r"',
+				SLEEP_TIME,
+				"Escape",
+				'Type "b"',
+				SLEEP_TIME,
+				"Ctrl+c",
+				SLEEP_TIME,
+				'Type "kk"',
+				SLEEP_TIME,
+				'Type "r"',
+				SLEEP_TIME,
+				'Type ":q!" Enter',
+			],
+		),
+		VHSTape(
+			name="Remove must have hovered item",
+			yazi_body=[
+				*SELECT_ITEMS_AND_ENTER_EMPTY_FOLDER_BODY,
+				'Type "x"',
+				LONG_SLEEP_TIME,
+				'Type "h"',
+				SLEEP_TIME,
+				'Type "x"',
+				SLEEP_TIME,
+				"Ctrl+c",
+			],
+		),
+		VHSTape(
+			name="Remove hovered item optional",
+			scripts=[
+				VHSTape.edit_plugin_config("must_have_hovered_item", False),
+			],
+			yazi_body=[
+				*SELECT_ITEMS_AND_ENTER_EMPTY_FOLDER_BODY,
+				SLEEP_TIME,
+				'Type "x"',
+				SLEEP_TIME,
+				"Ctrl+c",
+				SLEEP_TIME,
+				'Type "h"',
+				SLEEP_TIME,
+				'Type "x"',
+				SLEEP_TIME,
+				"Ctrl+c",
+			],
+		),
+		VHSTape(
+			name="Remove prompt",
+			scripts=[
+				VHSTape.edit_plugin_config("prompt", True),
+			],
+			yazi_body=[
+				f'Type "/{FIRST_FILE_NAME}" Enter',
+				"Space@300ms 3",
+				'Type "x"',
+				SLEEP_TIME,
+				'Type "h"',
+				SLEEP_TIME,
+				"Enter",
+				SLEEP_TIME,
+				"Ctrl+c",
+				SLEEP_TIME,
+				'Type "x"',
+				SLEEP_TIME,
+				'Type "s"',
+				SLEEP_TIME,
+				"Enter",
+				SLEEP_TIME,
+				"Ctrl+c",
+				SLEEP_TIME,
+				'Type "x"',
+				SLEEP_TIME,
+				"Enter",
+				SLEEP_TIME,
+				"Ctrl+c",
+			],
+		),
+		VHSTape(
+			name="Remove protected directory",
+			files_and_directories=[
+				"demo-1.txt",
+				"demo-2.txt",
+				"demo-3.txt",
+				"demo-4.txt",
+				"demo-5.txt",
+				os.path.join(PROTECTED_FOLDER, "demo-1.txt"),
+				os.path.join(PROTECTED_FOLDER, "demo-2.txt"),
+				os.path.join(PROTECTED_FOLDER, "demo-3.txt"),
+				os.path.join(PROTECTED_FOLDER, "demo-4.txt"),
+				os.path.join(PROTECTED_FOLDER, "demo-5.txt"),
+			],
+			scripts=[
+				VHSTape.edit_plugin_config(
+					"protected_directories",
+					"".join(
+						[
+							r'{{"',
+							str(PROTECTED_DIRECTORY.absolute()),
+							r'"}}',
+						]
+					),
+					r"{{}}",
+				),
+				VHSTape.create_keymap_toml_with_keymap(
+					{DEFAULT_KEY: "remove -- --permanently --force"}
+				),
+				Script(
+					setup="".join(
+						[
+							"Type `touch ",
+							" ".join(
+								"'{" + str(i) + "}'" for i in range(0, 10)
+							),
+							"` Enter",
+						]
+					),
+					required_programs=("touch",),
+				),
+			],
+			yazi_body=[
+				'Type "/{0}" Enter',
+				"Space@300ms 3",
+				f'Type "{DEFAULT_KEY}"',
+				SLEEP_TIME,
+				'Type "k"',
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				SLEEP_TIME,
+				f'Type "/{PROTECTED_FOLDER}" Enter',
+				SLEEP_TIME,
+				'Type "l"',
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				SLEEP_TIME,
+				"Ctrl+c",
+				SLEEP_TIME,
+				'Type "j"',
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				SLEEP_TIME,
+				"Ctrl+c",
+				SLEEP_TIME,
+				"Space@300ms 3",
+				'Type "k"',
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				SLEEP_TIME,
+				"Ctrl+c",
+			],
+		),
+		VHSTape(
+			name="Remove behaviour",
+			yazi_body=[
+				f'Type "/{FIRST_FILE_NAME}" Enter',
+				"Space@300ms 3",
+				SLEEP_TIME,
+				'Type "x"',
+				SLEEP_TIME,
+				"Ctrl+c",
+				SLEEP_TIME,
+				'Type "j"',
+				SLEEP_TIME,
+				'Type "x"',
+				SLEEP_TIME,
+				"Ctrl+c",
+				SLEEP_TIME,
+				'Type "kk"',
+				SLEEP_TIME,
+				'Type "x"',
+				SLEEP_TIME,
+				"Ctrl+c",
+			],
+		),
+		VHSTape(
+			name="Copy must have hovered item",
+			scripts=[
+				VHSTape.copy_text_to_clipboard(),
+			],
+			yazi_body=[
+				*SELECT_ITEMS_AND_ENTER_EMPTY_FOLDER_BODY,
+				SLEEP_TIME,
+				'Type "cf"',
+				SLEEP_TIME,
+				*PASTE_COPIED_TEXT_BODY,
+				SLEEP_TIME,
+				'Type "h"',
+				SLEEP_TIME,
+				'Type "cf"',
+				SLEEP_TIME,
+				*PASTE_COPIED_TEXT_BODY,
+			],
+		),
+		VHSTape(
+			name="Copy hovered item optional",
+			scripts=[
+				VHSTape.copy_text_to_clipboard(),
+				VHSTape.edit_plugin_config("must_have_hovered_item", False),
+			],
+			yazi_body=[
+				*SELECT_ITEMS_AND_ENTER_EMPTY_FOLDER_BODY,
+				SLEEP_TIME,
+				'Type "cf"',
+				SLEEP_TIME,
+				*PASTE_COPIED_TEXT_BODY,
+				SLEEP_TIME,
+				'Type "h"',
+				SLEEP_TIME,
+				'Type "cf"',
+				SLEEP_TIME,
+				*PASTE_COPIED_TEXT_BODY,
+			],
+		),
+		VHSTape(
+			name="Copy prompt",
+			scripts=[
+				VHSTape.copy_text_to_clipboard(),
+				VHSTape.edit_plugin_config("prompt", True),
+			],
+			yazi_body=[
+				f'Type "/{FIRST_FILE_NAME}" Enter',
+				"Space@300ms 3",
+				'Type "cf"',
+				SLEEP_TIME,
+				'Type "h"',
+				SLEEP_TIME,
+				"Enter",
+				SLEEP_TIME,
+				*PASTE_COPIED_TEXT_BODY,
+				SLEEP_TIME,
+				'Type "cf"',
+				SLEEP_TIME,
+				'Type "s"',
+				SLEEP_TIME,
+				"Enter",
+				SLEEP_TIME,
+				*PASTE_COPIED_TEXT_BODY,
+				SLEEP_TIME,
+				'Type "cf"',
+				SLEEP_TIME,
+				"Enter",
+				SLEEP_TIME,
+				*PASTE_COPIED_TEXT_BODY,
+			],
+		),
+		VHSTape(
+			name="Copy behaviour",
+			scripts=[
+				VHSTape.copy_text_to_clipboard(),
+			],
+			yazi_body=[
+				f'Type "/{FIRST_FILE_NAME}" Enter',
+				"Space@300ms 3",
+				SLEEP_TIME,
+				'Type "cf"',
+				SLEEP_TIME,
+				*PASTE_COPIED_TEXT_BODY,
+				SLEEP_TIME,
+				'Type "j"',
+				SLEEP_TIME,
+				'Type "cf"',
+				SLEEP_TIME,
+				*PASTE_COPIED_TEXT_BODY,
+				SLEEP_TIME,
+				'Type "kk"',
+				SLEEP_TIME,
+				'Type "cf"',
+				SLEEP_TIME,
+				*PASTE_COPIED_TEXT_BODY,
+			],
+		),
+		VHSTape(
+			name="Create behaviour",
+			files_and_directories=[
+				"demo_file.txt",
+				"test_file.txt",
+				"demo_dir",
+				"test_dir",
+				"demo_dir.txt",
+				"dir_to_overwrite",
+				"file_to_overwrite.txt",
+			],
+			scripts=[
+				Script(
+					setup="Type `mkdir '{5}'` Enter",
+					required_programs=("mkdir",),
+				),
+				Script(
+					setup="Type `touch '{6}'` Enter",
+					required_programs=("touch",),
+				),
+			],
+			yazi_body=[
+				'Type "_{0}" Enter',
+				SLEEP_TIME,
+				'Type "/{0}" Enter',
+				SLEEP_TIME,
+				'Type "_{1}" Enter',
+				SLEEP_TIME,
+				'Type "/{1}" Enter',
+				SLEEP_TIME,
+				'Type "_{2}" Enter',
+				SLEEP_TIME,
+				'Type "/{2}" Enter',
+				SLEEP_TIME,
+				'Type "_{3}/" Enter',
+				SLEEP_TIME,
+				'Type "/{3}" Enter',
+				SLEEP_TIME,
+				'Type "_{4}/"',
+				SLEEP_TIME,
+				"Enter",
+				SLEEP_TIME,
+				'Type "/{4}" Enter',
+				SLEEP_TIME,
+				'Type "_{5}" Enter',
+				SLEEP_TIME,
+				"Ctrl+c",
+				SLEEP_TIME,
+				'Type "/{5}" Enter',
+				SLEEP_TIME,
+				'Type "_{6}" Enter',
+				SLEEP_TIME,
+				"Ctrl+c",
+				SLEEP_TIME,
+				'Type "/{6}" Enter',
+			],
+		),
+		VHSTape(
+			name="Create and open files",
+			files_and_directories=[
+				"demo_file.txt",
+				"test_file.txt",
+				"demo_dir",
+				"test_dir",
+			],
+			scripts=[
+				VHSTape.edit_plugin_config("open_file_after_creation", True),
+			],
+			yazi_body=[
+				'Type "_{0}" Enter',
+				SLEEP_TIME,
+				'Type ":q!" Enter',
+				SLEEP_TIME,
+				'Type "_{1}" Enter',
+				SLEEP_TIME,
+				'Type ":q!" Enter',
+				SLEEP_TIME,
+				'Type "_{2}" Enter',
+				SLEEP_TIME,
+				'Type "/{2}" Enter',
+				SLEEP_TIME,
+				'Type "_{3}/" Enter',
+				SLEEP_TIME,
+				'Type "/{3}" Enter',
+			],
+		),
+		VHSTape(
+			name="Create and enter directories",
+			files_and_directories=[
+				"demo_dir",
+				"test_dir",
+				"demo_file.txt",
+				"test_file.txt",
+			],
+			scripts=[
+				VHSTape.edit_plugin_config(
+					"enter_directory_after_creation", True
+				),
+			],
+			yazi_body=[
+				'Type "_{0}" Enter',
+				SLEEP_TIME,
+				'Type "h"',
+				SLEEP_TIME,
+				'Type "_{1}/"',
+				SLEEP_TIME,
+				"Enter",
+				SLEEP_TIME,
+				'Type "h"',
+				SLEEP_TIME,
+				'Type "_{2}" Enter',
+				SLEEP_TIME,
+				'Type "/{2}" Enter',
+				SLEEP_TIME,
+				'Type "_{3}" Enter',
+				SLEEP_TIME,
+				'Type "/{3}" Enter',
+			],
+		),
+		VHSTape(
+			name="Create and open files and directories",
+			files_and_directories=[
+				"demo_file.txt",
+				"test_file.txt",
+				"demo_dir",
+				"test_dir",
+			],
+			scripts=[
+				VHSTape.edit_plugin_config("open_file_after_creation", True),
+				VHSTape.edit_plugin_config(
+					"enter_directory_after_creation", True
+				),
+			],
+			yazi_body=[
+				'Type "_{0}" Enter',
+				SLEEP_TIME,
+				'Type ":q!" Enter',
+				SLEEP_TIME,
+				'Type "_{1}" Enter',
+				SLEEP_TIME,
+				'Type ":q!" Enter',
+				SLEEP_TIME,
+				'Type "_{2}" Enter',
+				SLEEP_TIME,
+				'Type "h"',
+				SLEEP_TIME,
+				'Type "_{3}/" Enter',
+				SLEEP_TIME,
+				'Type "h"',
+			],
+		),
+		VHSTape(
+			name="Create default behaviour",
+			files_and_directories=[
+				"demo_file.txt",
+				"test_file.txt",
+				"demo_dir",
+				"test_dir",
+			],
+			scripts=[
+				VHSTape.edit_plugin_config("use_default_create_behaviour", True)
+			],
+			yazi_body=[
+				'Type "_{0}" Enter',
+				SLEEP_TIME,
+				'Type "/{0}" Enter',
+				SLEEP_TIME,
+				'Type "_{1}" Enter',
+				SLEEP_TIME,
+				'Type "/{1}" Enter',
+				SLEEP_TIME,
+				'Type "_{2}" Enter',
+				SLEEP_TIME,
+				'Type "/{2}" Enter',
+				SLEEP_TIME,
+				'Type "_{3}/" Enter',
+				SLEEP_TIME,
+				'Type "/{3}" Enter',
+			],
+		),
+		VHSTape(
+			name="Shell must have hovered item",
+			scripts=[
+				VHSTape.create_shell_keymap_toml(
+					DEFAULT_KEY, r"\$SHELL", ("block",)
+				),
+			],
+			yazi_body=[
+				*SELECT_ITEMS_AND_ENTER_EMPTY_FOLDER_BODY,
+				f'Type "{DEFAULT_KEY}"',
+				LONG_SLEEP_TIME,
+				'Type "h"',
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				SLEEP_TIME,
+				'Type "exit" Enter',
+			],
+		),
+		VHSTape(
+			name="Shell hovered item optional",
+			scripts=[
+				VHSTape.edit_plugin_config("must_have_hovered_item", False),
+				VHSTape.create_shell_keymap_toml(
+					DEFAULT_KEY, r"\$SHELL", ("block",)
+				),
+			],
+			yazi_body=[
+				*SELECT_ITEMS_AND_ENTER_EMPTY_FOLDER_BODY,
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				SLEEP_TIME,
+				'Type "exit" Enter',
+				SLEEP_TIME,
+				'Type "h"',
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				SLEEP_TIME,
+				'Type "exit" Enter',
+			],
+		),
+		VHSTape(
+			name="Shell prompt",
+			scripts=[
+				VHSTape.edit_plugin_config("prompt", True),
+				VHSTape.create_shell_keymap_toml(
+					DEFAULT_KEY, r"echo %s | less", ("block",)
+				),
+			],
+			yazi_body=[
+				f'Type "/{FIRST_FILE_NAME}" Enter',
+				"Space@300ms 3",
+				f'Type "{DEFAULT_KEY}"',
+				SLEEP_TIME,
+				'Type "h"',
+				SLEEP_TIME,
+				"Enter",
+				LONG_SLEEP_TIME,
+				'Type "q"',
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				SLEEP_TIME,
+				'Type "s"',
+				SLEEP_TIME,
+				"Enter",
+				LONG_SLEEP_TIME,
+				'Type "q"',
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				SLEEP_TIME,
+				"Enter",
+				LONG_SLEEP_TIME,
+				'Type "q"',
+			],
+		),
+		VHSTape(
+			name="Shell behaviour",
+			scripts=[
+				VHSTape.create_shell_keymap_toml(
+					DEFAULT_KEY, r"echo %s | less", ("block",)
+				),
+			],
+			yazi_body=[
+				f'Type "/{FIRST_FILE_NAME}" Enter',
+				"Space@300ms 3",
+				SLEEP_TIME,
+				'Type "k"',
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				LONG_SLEEP_TIME,
+				'Type "q"',
+				SLEEP_TIME,
+				'Type "j"',
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				LONG_SLEEP_TIME,
+				'Type "q"',
+				SLEEP_TIME,
+				'Type "j"',
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				LONG_SLEEP_TIME,
+				'Type "q"',
+			],
+		),
+		VHSTape(
+			name="Shell exit if directory",
+			scripts=[
+				VHSTape.create_shell_keymap_toml(
+					DEFAULT_KEY, r"\$SHELL", ("block", "exit-if-dir")
+				),
+			],
+			yazi_body=[
+				f'Type "/{FIRST_FILE_NAME}" Enter',
+				"Space@300ms 3",
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				SLEEP_TIME,
+				'Type "exit" Enter',
+				SLEEP_TIME,
+				'Type "j"',
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				SLEEP_TIME,
+				'Type "exit" Enter',
+				SLEEP_TIME,
+				'Type "kk"',
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				SLEEP_TIME,
+				'Type "exit" Enter',
+				SLEEP_TIME,
+				'Type "gg"',
+				"Space@300ms 2",
+				'Type "k"',
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				SLEEP_TIME,
+				'Type "exit" Enter',
+				SLEEP_TIME,
+				"Escape 2",
+				'Type "gg"',
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				SLEEP_TIME,
+				'Type "j"',
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				SLEEP_TIME,
+				'Type "gg"',
+				"Space@300ms 2",
+				'Type "k"',
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+			],
+		),
+		VHSTape(
+			name="Smart paste",
+			files_and_directories=[
+				"demo.txt",
+				"demo_1.txt",
+				"**/demo.txt",
+				"**/demo_1.txt",
+			],
+			scripts=[
+				VHSTape.edit_plugin_config("smart_paste", True),
+				Script(
+					setup=f"Type `echo '{DEFAULT_TEXT_FILE_CONTENT}' "
+					+ "> {0}` Enter",
+					required_programs=("echo",),
+				),
+			],
+			yazi_body=[
+				'Type "/{0}" Enter',
+				'Type "y"',
+				SLEEP_TIME,
+				'Type "gg"',
+				SLEEP_TIME,
+				'Type "p"',
+				SLEEP_TIME,
+				'Type "l"',
+				SLEEP_TIME,
+				'Type "/{0}" Enter',
+				SLEEP_TIME,
+				'Type "h"',
+				SLEEP_TIME,
+				'Type "j"',
+				SLEEP_TIME,
+				'Type "p"',
+				SLEEP_TIME,
+				'Type "l"',
+				SLEEP_TIME,
+				'Type "n"',
+				SLEEP_TIME,
+				'Type "h"',
+				SLEEP_TIME,
+				'Type "j"',
+				SLEEP_TIME,
+				'Type "p"',
+				SLEEP_TIME,
+				'Type "l"',
+				SLEEP_TIME,
+				'Type "n"',
+				SLEEP_TIME,
+				'Type "k"',
+				SLEEP_TIME,
+				'Type "p"',
+				SLEEP_TIME,
+				'Type "l"',
+				SLEEP_TIME,
+				'Type "hh"',
+				SLEEP_TIME,
+				'Type "n"',
+				SLEEP_TIME,
+				'Type "p"',
+				SLEEP_TIME,
+				'Type "/{1}" Enter',
+			],
+		),
+		VHSTape(
+			name="Smart tab create",
+			scripts=[
+				VHSTape.edit_plugin_config("smart_tab_create", True),
+			],
+			yazi_body=[
+				f'Type "/{FIRST_FILE_NAME}" Enter',
+				SLEEP_TIME,
+				'Type "tt"',
+				SLEEP_TIME,
+				'Type "j"',
+				SLEEP_TIME,
+				'Type "tt"',
+				SLEEP_TIME,
+				'Type "gg"',
+				SLEEP_TIME,
+				'Type "tt"',
+				SLEEP_TIME,
+				'Type "tt"',
+				SLEEP_TIME,
+				'Type "h"',
+				SLEEP_TIME,
+				'Type "j"',
+				SLEEP_TIME,
+				'Type "tt"',
+				SLEEP_TIME,
+				'Type "tt"',
+			],
+		),
+		VHSTape(
+			name="Smart tab switch",
+			scripts=[
+				VHSTape.edit_plugin_config("smart_tab_switch", True),
+				VHSTape.create_tab_switch_keymap_toml(),
+			],
+			yazi_body=[
+				'Type "l"',
+				SLEEP_TIME,
+				'Type "2"',
+				SLEEP_TIME,
+				'Type "]"',
+				SLEEP_TIME,
+				'Type "h"',
+				SLEEP_TIME,
+				VHSTape.press_key_repeatedly("]", 4),
+				SLEEP_TIME,
+				'Type "8"',
+				SLEEP_TIME,
+				VHSTape.press_key_repeatedly("]", 17),
+			],
+		),
+		VHSTape(
+			name="Quit with confirmation",
+			skip_quitting_yazi=True,
+			scripts=[
+				VHSTape.create_keymap_toml_with_keymap({"q": "quit"}),
+			],
+			yazi_body=[
+				SLEEP_TIME,
+				'Type "q"',
+				'Type "yazi" Enter',
+				SLEEP_TIME,
+				'Type "tt"',
+				SLEEP_TIME,
+				'Type "q"',
+				SLEEP_TIME,
+				'Type "n"',
+				SLEEP_TIME,
+				'Type "q"',
+				SLEEP_TIME,
+				'Type "y"',
+				SLEEP_TIME,
+			],
+		),
+		VHSTape(
+			name="Smooth arrow",
+			scripts=[
+				VHSTape.edit_plugin_config("wraparound_file_navigation", False),
+				VHSTape.edit_plugin_config("smooth_scrolling", True),
+				VHSTape.create_keymap_toml_with_keymap(
+					{
+						"j": "arrow -- 10",
+						"k": "arrow -- -10",
+					}
+				),
+			],
+			yazi_body=[
+				"Type 'j'",
+				SLEEP_TIME,
+				"Type 'j'",
+				SLEEP_TIME,
+				"Type 'k'",
+				SLEEP_TIME,
+				"Type 'k'",
+				SLEEP_TIME,
+				"Type 'j'",
+				"Type 'j'",
+				SLEEP_TIME,
+				"Type 'k'",
+				"Type 'k'",
+			],
+		),
+		VHSTape(
+			name="Wraparound arrow",
+			yazi_body=[
+				VHSTape.press_key_repeatedly("j", 20),
+				SLEEP_TIME,
+				VHSTape.press_key_repeatedly("k", 20),
+			],
+		),
+		VHSTape(
+			name="Smooth wraparound arrow",
+			scripts=[
+				VHSTape.edit_plugin_config("smooth_scrolling", True),
+				VHSTape.create_keymap_toml_with_keymap(
+					{
+						"d": "arrow -- 10",
+						"u": "arrow -- -10",
+					}
+				),
+			],
+			yazi_body=[
+				VHSTape.press_key_repeatedly("j", 5),
+				SLEEP_TIME,
+				"Type 'u'",
+				SLEEP_TIME,
+				"Type 'u'",
+				SLEEP_TIME,
+				"Type 'G'",
+				SLEEP_TIME,
+				VHSTape.press_key_repeatedly("k", 5),
+				SLEEP_TIME,
+				"Type 'd'",
+				SLEEP_TIME,
+				"Type 'd'",
+			],
+		),
+		VHSTape(
+			name="Parent arrow",
+			scripts=[
+				VHSTape.edit_plugin_config("wraparound_file_navigation", False),
+			],
+			yazi_body=[
+				'Type "l"',
+				SHORT_SLEEP_TIME,
+				'Type "l"',
+				SLEEP_TIME,
+				VHSTape.press_key_repeatedly("J", 4),
+				SLEEP_TIME,
+				VHSTape.press_key_repeatedly("K", 4),
+				SLEEP_TIME,
+				VHSTape.press_key_repeatedly("J", 4),
+				SLEEP_TIME,
+				VHSTape.press_key_repeatedly("K", 4),
+			],
+		),
+		VHSTape(
+			name="Smooth parent arrow",
+			scripts=[
+				VHSTape.edit_plugin_config("wraparound_file_navigation", False),
+				VHSTape.edit_plugin_config("smooth_scrolling", True),
+				VHSTape.create_keymap_toml_with_keymap(
+					{
+						"J": "parent-arrow -- 5",
+						"K": "parent-arrow -- -5",
+					}
+				),
+			],
+			yazi_body=[
+				"Type 'l'",
+				SLEEP_TIME,
+				"Type 'J'",
+				SLEEP_TIME,
+				"Type 'K'",
+				SLEEP_TIME,
+				"Type 'J'",
+				SLEEP_TIME,
+				"Type 'K'",
+				SLEEP_TIME,
+				"Type 'J'",
+				"Type 'K'",
+				SLEEP_TIME,
+				"Type 'J'",
+				"Type 'K'",
+			],
+		),
+		VHSTape(
+			name="Wraparound parent arrow",
+			yazi_body=[
+				'Type "l"',
+				SHORT_SLEEP_TIME,
+				'Type "l"',
+				SLEEP_TIME,
+				VHSTape.press_key_repeatedly("J", 20),
+				SLEEP_TIME,
+				VHSTape.press_key_repeatedly("K", 20),
+			],
+		),
+		VHSTape(
+			name="Smooth wraparound parent arrow",
+			scripts=[
+				VHSTape.edit_plugin_config("smooth_scrolling", True),
+				VHSTape.create_keymap_toml_with_keymap(
+					{
+						"J": "parent-arrow -- 1",
+						"K": "parent-arrow -- -1",
+						"d": "parent-arrow -- 5",
+						"u": "parent-arrow -- -5",
+					}
+				),
+			],
+			yazi_body=[
+				"Type 'l'",
+				SLEEP_TIME,
+				VHSTape.press_key_repeatedly("J", 5),
+				SLEEP_TIME,
+				"Type 'u'",
+				SLEEP_TIME,
+				"Type 'u'",
+				SLEEP_TIME,
+				"Type 'h'",
+				SLEEP_TIME,
+				f'Type "/{FIRST_FILE_NAME}" Enter',
+				SLEEP_TIME,
+				"Type 'k'",
+				SLEEP_TIME,
+				"Type 'l'",
+				SLEEP_TIME,
+				VHSTape.press_key_repeatedly("K", 5),
+				SLEEP_TIME,
+				"Type 'd'",
+				SLEEP_TIME,
+				"Type 'd'",
+			],
+		),
+		VHSTape(
+			name="First file",
+			yazi_body=[
+				"Type 'gf'",
+				SLEEP_TIME,
+				"Type 'gg'",
+				SLEEP_TIME,
+				"Type 'gf'",
+				SLEEP_TIME,
+				"Type 'G'",
+				SLEEP_TIME,
+				"Type 'gf'",
+			],
+		),
+		VHSTape(
+			name="Smooth first file",
+			scripts=[
+				VHSTape.edit_plugin_config("smooth_scrolling", True),
+			],
+			yazi_body=[
+				"Type 'gf'",
+				SLEEP_TIME,
+				"Type 'gg'",
+				SLEEP_TIME,
+				"Type 'gf'",
+				SLEEP_TIME,
+				"Type 'G'",
+				SLEEP_TIME,
+				"Type 'gf'",
+			],
+		),
+		VHSTape(
+			name="Archive must have hovered item",
+			files_and_directories=["demo.zip"],
+			scripts=[
+				VHSTape.edit_plugin_config("reveal_created_archive", False),
+				VHSTape.create_keymap_toml_with_keymap(
+					{DEFAULT_KEY: "archive"}
+				),
+			],
+			yazi_body=[
+				*SELECT_ITEMS_AND_ENTER_EMPTY_FOLDER_BODY,
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				LONG_SLEEP_TIME,
+				'Type "h"',
+				SLEEP_TIME,
+				f'Type "/{FIRST_FILE_NAME}" Enter',
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				SLEEP_TIME,
+				'Type "{0}" Enter',
+				SLEEP_TIME,
+				'Type "gg"',
+				SLEEP_TIME,
+				'Type "/{0}" Enter',
+			],
+		),
+		VHSTape(
+			name="Archive hovered item optional",
+			files_and_directories=["demo.zip", "**/demo.zip"],
+			scripts=[
+				VHSTape.edit_plugin_config("must_have_hovered_item", False),
+				VHSTape.edit_plugin_config("reveal_created_archive", False),
+				VHSTape.create_keymap_toml_with_keymap(
+					{DEFAULT_KEY: "archive"}
+				),
+			],
+			yazi_body=[
+				*SELECT_ITEMS_AND_ENTER_EMPTY_FOLDER_BODY,
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				SLEEP_TIME,
+				'Type "{0}" Enter',
+				SLEEP_TIME,
+				'Type "/{0}" Enter',
+				SLEEP_TIME,
+				'Type "h"',
+				SLEEP_TIME,
+				f'Type "/{FIRST_FILE_NAME}" Enter',
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				SLEEP_TIME,
+				'Type "{0}" Enter',
+				SLEEP_TIME,
+				'Type "/{0}" Enter',
+			],
+		),
+		VHSTape(
+			name="Archive prompt",
+			files_and_directories=[
+				"demo.zip",
+				"demo-1.zip",
+				"demo-2.zip",
+			],
+			scripts=[
+				VHSTape.edit_plugin_config("prompt", True),
+				VHSTape.edit_plugin_config("reveal_created_archive", False),
+				VHSTape.create_keymap_toml_with_keymap(
+					{DEFAULT_KEY: "archive"}
+				),
+			],
+			yazi_body=[
+				f'Type "/{FIRST_FILE_NAME}" Enter',
+				SLEEP_TIME,
+				'Type "j"',
+				"Space@300ms 3",
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				SLEEP_TIME,
+				'Type "h" Enter',
+				SLEEP_TIME,
+				'Type "{0}" Enter',
+				SLEEP_TIME,
+				'Type "gg"',
+				SLEEP_TIME,
+				'Type "/{0}" Enter',
+				SLEEP_TIME,
+				f'Type "/{FIRST_FILE_NAME}" Enter',
+				'Type "jjjj"',
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				SLEEP_TIME,
+				'Type "s" Enter',
+				SLEEP_TIME,
+				'Type "{1}" Enter',
+				SLEEP_TIME,
+				'Type "gg"',
+				SLEEP_TIME,
+				'Type "/{1}" Enter',
+				SLEEP_TIME,
+				f'Type "/{FIRST_FILE_NAME}" Enter',
+				'Type "jjjj"',
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				SLEEP_TIME,
+				"Enter",
+				SLEEP_TIME,
+				'Type "{2}" Enter',
+				SLEEP_TIME,
+				'Type "gg"',
+				SLEEP_TIME,
+				'Type "/{2}" Enter',
+			],
+		),
+		VHSTape(
+			name="Archive behaviour",
+			files_and_directories=[
+				"demo.zip",
+				"demo-1.zip",
+				"demo.txt",
+				"demo.txt.zip",
+				"demo-2",
+				"demo-2.zip",
+				"archive_to_overwrite.zip",
+			],
+			scripts=[
+				VHSTape.edit_plugin_config("reveal_created_archive", False),
+				VHSTape.create_keymap_toml_with_keymap(
+					{DEFAULT_KEY: "archive"}
+				),
+				VHSTape.create_nested_archive(4, "{6}"),
+				Script(
+					setup=f"Type `echo '{DEFAULT_TEXT_FILE_CONTENT}' > "
+					+ "{2}` Enter",
+					required_programs=("echo",),
+				),
+			],
+			yazi_body=[
+				f'Type "/{FIRST_FILE_NAME}" Enter',
+				SLEEP_TIME,
+				'Type "j"',
+				"Space@300ms 3",
+				'Type "k"',
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				SLEEP_TIME,
+				'Type "{0}" Enter',
+				SLEEP_TIME,
+				'Type "gg"',
+				SLEEP_TIME,
+				'Type "/{0}" Enter',
+				SLEEP_TIME,
+				f'Type "/{FIRST_FILE_NAME}" Enter',
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				SLEEP_TIME,
+				'Type "{1}" Enter',
+				SLEEP_TIME,
+				'Type "gg"',
+				SLEEP_TIME,
+				'Type "/{1}" Enter',
+				SLEEP_TIME,
+				'Type "/{2}" Enter',
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				SLEEP_TIME,
+				"Enter",
+				SLEEP_TIME,
+				'Type "gg"',
+				SLEEP_TIME,
+				'Type "/{3}" Enter',
+				SLEEP_TIME,
+				f'Type "/{FIRST_FILE_NAME}" Enter',
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				SLEEP_TIME,
+				'Type "{4}" Enter',
+				SLEEP_TIME,
+				'Type "/{5}" Enter',
+				SLEEP_TIME,
+				f'Type "/{FIRST_FILE_NAME}" Enter',
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				SLEEP_TIME,
+				'Type "{6}" Enter',
+				SLEEP_TIME,
+				"Ctrl+c",
+				SLEEP_TIME,
+				'Type "/{6}" Enter',
+			],
+		),
+		VHSTape(
+			name="Archive encrypt files",
+			files_and_directories=["demo.7z"],
+			scripts=[
+				VHSTape.edit_plugin_config("reveal_created_archive", False),
+				VHSTape.create_keymap_toml_with_keymap(
+					{DEFAULT_KEY: "archive -- --encrypt --encrypt-headers"}
+				),
+			],
+			yazi_body=[
+				f'Type "/{FIRST_FILE_NAME}" Enter',
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				SLEEP_TIME,
+				'Type "{0}" Enter',
+				SLEEP_TIME,
+				'Type "{0}" Enter',
+				SLEEP_TIME,
+				'Type "{0}" Enter',
+				SLEEP_TIME,
+				'Type "/{0}" Enter',
+			],
+		),
+		VHSTape(
+			name="Archive reveal created archive",
+			files_and_directories=["demo.zip"],
+			scripts=[
+				VHSTape.create_keymap_toml_with_keymap(
+					{DEFAULT_KEY: "archive"}
+				),
+			],
+			yazi_body=[
+				f'Type "/{FIRST_FILE_NAME}" Enter',
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				SLEEP_TIME,
+				'Type "{0}" Enter',
+			],
+		),
+		VHSTape(
+			name="Archive remove archived files",
+			files_and_directories=[
+				"demo.zip",
+				"demo-1.txt",
+				"demo-2.txt",
+				"demo-3.txt",
+				"demo-4.txt",
+				"demo-5.txt",
+			],
+			scripts=[
+				VHSTape.edit_plugin_config("reveal_created_archive", False),
+				VHSTape.create_keymap_toml_with_keymap(
+					{DEFAULT_KEY: "archive -- --remove"}
+				),
+				Script(
+					setup="\n".join(
+						f"Type `echo '{DEFAULT_TEXT_FILE_CONTENT}' > "
+						+ "{"
+						+ str(i)
+						+ "}` Enter"
+						for i in range(1, 6)
+					),
+					required_programs=("echo",),
+				),
+			],
+			yazi_body=[
+				'Type "/{1}" Enter',
+				SLEEP_TIME,
+				"Space@300ms 5",
+				'Type "k"',
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				SLEEP_TIME,
+				'Type "{0}" Enter',
+				SLEEP_TIME,
+				'Type "/{1}" Enter',
+			],
+		),
+		VHSTape(
+			name="Archive remove protected archived files",
+			files_and_directories=[
+				os.path.join(PROTECTED_FOLDER, "demo.zip"),
+				os.path.join(PROTECTED_FOLDER, "demo-1.txt"),
+				os.path.join(PROTECTED_FOLDER, "demo-2.txt"),
+				os.path.join(PROTECTED_FOLDER, "demo-3.txt"),
+				os.path.join(PROTECTED_FOLDER, "demo-4.txt"),
+				os.path.join(PROTECTED_FOLDER, "demo-5.txt"),
+				"demo.zip",
+				"demo-1.txt",
+			],
+			scripts=[
+				VHSTape.edit_plugin_config(
+					"protected_directories",
+					"".join(
+						[
+							r'{{"',
+							str(PROTECTED_DIRECTORY.absolute()),
+							r'"}}',
+						]
+					),
+					r"{{}}",
+				),
+				VHSTape.edit_plugin_config("reveal_created_archive", False),
+				VHSTape.create_keymap_toml_with_keymap(
+					{DEFAULT_KEY: "archive -- --remove"}
+				),
+				Script(
+					setup="\n".join(
+						f"Type `echo '{DEFAULT_TEXT_FILE_CONTENT}' > "
+						+ "{"
+						+ str(i)
+						+ "}` Enter"
+						for i in range(1, 6)
+					),
+					required_programs=("echo",),
+				),
+			],
+			yazi_body=[
+				f'Type "/{PROTECTED_FOLDER}" Enter',
+				SLEEP_TIME,
+				'Type "l"',
+				SLEEP_TIME,
+				'Type "/{7}" Enter',
+				SLEEP_TIME,
+				"Space@300ms 5",
+				'Type "k"',
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				SLEEP_TIME,
+				'Type "{6}" Enter',
+				SLEEP_TIME,
+				"Ctrl+c",
+				SLEEP_TIME,
+				'Type "/{6}" Enter',
+			],
+		),
+		VHSTape(
+			name="Emit Yazi command",
+			scripts=[
+				VHSTape.create_keymap_toml_with_keymap({DEFAULT_KEY: "emit"})
+			],
+			yazi_body=[
+				f'Type "{DEFAULT_KEY}"',
+				SLEEP_TIME,
+				'Type "arrow next" Enter',
+			],
+		),
+		VHSTape(
+			name="Emit plugin command",
+			scripts=[
+				VHSTape.create_keymap_toml_with_keymap(
+					{DEFAULT_KEY: "emit -- --plugin"}
+				)
+			],
+			yazi_body=[
+				'Type "l"',
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				SLEEP_TIME,
+				'Type "augment-command.parent-arrow -- 1" Enter',
+			],
+		),
+		VHSTape(
+			name="Emit augmented command",
+			scripts=[
+				VHSTape.create_keymap_toml_with_keymap(
+					{DEFAULT_KEY: "emit -- --augmented"}
+				)
+			],
+			yazi_body=[
+				'Type "l"',
+				SLEEP_TIME,
+				f'Type "{DEFAULT_KEY}"',
+				SLEEP_TIME,
+				'Type "parent-arrow 1" Enter',
+			],
+		),
+		VHSTape(
+			name="Editor must have hovered item",
+			editor="emacs -nw",
+			yazi_body=[
+				*SELECT_ITEMS_AND_ENTER_EMPTY_FOLDER_BODY,
+				'Type "o"',
+				LONG_SLEEP_TIME,
+				'Type "h"',
+				SLEEP_TIME,
+				f'Type "/{FIRST_FILE_NAME}" Enter',
+				SLEEP_TIME,
+				#
+				# Open the editor
+				'Type "o"',
+				VERY_LONG_SLEEP_TIME,
+				'Type ":qa!" Enter',
+			],
+		),
+		VHSTape(
+			name="Editor hovered item optional",
+			editor="emacs -nw",
+			scripts=[
+				VHSTape.edit_plugin_config("must_have_hovered_item", False),
+			],
+			yazi_body=[
+				*SELECT_ITEMS_AND_ENTER_EMPTY_FOLDER_BODY,
+				SLEEP_TIME,
+				#
+				# Open the editor
+				'Type "o"',
+				VERY_LONG_SLEEP_TIME,
+				'Type ":qa!" Enter',
+				SLEEP_TIME,
+				'Type "h"',
+				SLEEP_TIME,
+				f'Type "/{FIRST_FILE_NAME}" Enter',
+				SLEEP_TIME,
+				#
+				# Open the editor
+				'Type "o"',
+				VERY_LONG_SLEEP_TIME,
+				'Type ":qa!" Enter',
+			],
+		),
+		VHSTape(
+			name="Editor prompt",
+			editor="emacs -nw",
+			scripts=[
+				VHSTape.edit_plugin_config("prompt", True),
+			],
+			yazi_body=[
+				f'Type "/{FIRST_FILE_NAME}" Enter',
+				"Space@300ms 3",
+				'Type "o"',
+				SLEEP_TIME,
+				'Type "h"',
+				SLEEP_TIME,
+				"Enter",
+				#
+				# Waiting for the editor to open
+				VERY_LONG_SLEEP_TIME,
+				'Type ":qa!" Enter',
+				SLEEP_TIME,
+				'Type "o"',
+				SLEEP_TIME,
+				'Type "s"',
+				SLEEP_TIME,
+				"Enter",
+				#
+				# Waiting for the editor to open
+				VERY_LONG_SLEEP_TIME,
+				'Type ":qa!" Enter',
+				SLEEP_TIME,
+				'Type "o"',
+				SLEEP_TIME,
+				"Enter",
+				#
+				# Waiting for the editor to open
+				VERY_LONG_SLEEP_TIME,
+				'Type ":qa!" Enter',
+			],
+		),
+		VHSTape(
+			name="Editor behaviour",
+			editor="emacs -nw",
+			yazi_body=[
+				f'Type "/{FIRST_FILE_NAME}" Enter',
+				"Space@300ms 3",
+				SLEEP_TIME,
+				#
+				# Open the editor
+				'Type "o"',
+				VERY_LONG_SLEEP_TIME,
+				'Type ":qa!" Enter',
+				SLEEP_TIME,
+				'Type "j"',
+				SLEEP_TIME,
+				#
+				# Open the editor
+				'Type "o"',
+				VERY_LONG_SLEEP_TIME,
+				'Type ":qa!" Enter',
+				SLEEP_TIME,
+				'Type "kk"',
+				SLEEP_TIME,
+				#
+				# Open the editor
+				'Type "o"',
+				VERY_LONG_SLEEP_TIME,
+				'Type ":qa!" Enter',
+			],
+		),
+		VHSTape(
+			name="Pager must have hovered item",
+			yazi_body=[
+				*SELECT_ITEMS_AND_ENTER_EMPTY_FOLDER_BODY,
+				'Type "i"',
+				LONG_SLEEP_TIME,
+				'Type "h"',
+				SLEEP_TIME,
+				f'Type "/{FIRST_FILE_NAME}" Enter',
+				SLEEP_TIME,
+				'Type "i"',
+				SLEEP_TIME,
+				'Type "q"',
+			],
+		),
+		VHSTape(
+			name="Pager hovered item optional",
+			scripts=[
+				VHSTape.edit_plugin_config("must_have_hovered_item", False),
+			],
+			yazi_body=[
+				*SELECT_ITEMS_AND_ENTER_EMPTY_FOLDER_BODY,
+				SLEEP_TIME,
+				'Type "i"',
+				SLEEP_TIME,
+				'Type ":n"',
+				SLEEP_TIME,
+				'Type ":n"',
+				SLEEP_TIME,
+				'Type ":n"',
+				SLEEP_TIME,
+				'Type "q"',
+				SLEEP_TIME,
+				'Type "h"',
+				SLEEP_TIME,
+				f'Type "/{FIRST_FILE_NAME}" Enter',
+				SLEEP_TIME,
+				'Type "i"',
+				SLEEP_TIME,
+				'Type "q"',
+			],
+		),
+		VHSTape(
+			name="Pager prompt",
+			scripts=[
+				VHSTape.edit_plugin_config("prompt", True),
+			],
+			yazi_body=[
+				f'Type "/{FIRST_FILE_NAME}" Enter',
+				"Space@300ms 3",
+				'Type "i"',
+				SLEEP_TIME,
+				'Type "h"',
+				SLEEP_TIME,
+				"Enter",
+				SLEEP_TIME,
+				'Type "q"',
+				SLEEP_TIME,
+				'Type "i"',
+				SLEEP_TIME,
+				'Type "s"',
+				SLEEP_TIME,
+				"Enter",
+				SLEEP_TIME,
+				'Type ":n"',
+				SLEEP_TIME,
+				'Type ":n"',
+				SLEEP_TIME,
+				'Type ":n"',
+				SLEEP_TIME,
+				'Type "q"',
+				SLEEP_TIME,
+				'Type "i"',
+				SLEEP_TIME,
+				"Enter",
+				SLEEP_TIME,
+				'Type "q"',
+			],
+		),
+		VHSTape(
+			name="Pager behaviour",
+			yazi_body=[
+				f'Type "/{FIRST_FILE_NAME}" Enter',
+				"Space@300ms 3",
+				SLEEP_TIME,
+				'Type "i"',
+				SLEEP_TIME,
+				'Type "q"',
+				SLEEP_TIME,
+				'Type "j"',
+				SLEEP_TIME,
+				'Type "i"',
+				SLEEP_TIME,
+				'Type "q"',
+				SLEEP_TIME,
+				'Type "kk"',
+				SLEEP_TIME,
+				'Type "i"',
+				SLEEP_TIME,
+				'Type ":n"',
+				SLEEP_TIME,
+				'Type ":n"',
+				SLEEP_TIME,
+				'Type ":n"',
+				SLEEP_TIME,
+				'Type "q"',
+				SLEEP_TIME,
+				'Type "gg"',
+				"Space@300ms 2",
+				'Type "k"',
+				SLEEP_TIME,
+				'Type "i"',
+				SLEEP_TIME,
+				"Enter",
+				SLEEP_TIME,
+				'Type ":n"',
+				SLEEP_TIME,
+				'Type ":n"',
+				SLEEP_TIME,
+				'Type ":n"',
+				SLEEP_TIME,
+				'Type "q"',
+				SLEEP_TIME,
+				"Escape 2",
+				'Type "gg"',
+				SLEEP_TIME,
+				'Type "u"',
+				SLEEP_TIME,
+				'Type "i"',
+				SLEEP_TIME,
+				'Type "j"',
+				SLEEP_TIME,
+				'Type "i"',
+				SLEEP_TIME,
+				'Type "gg"',
+				"Space@300ms 2",
+				'Type "k"',
+				SLEEP_TIME,
+				'Type "i"',
+			],
+		),
+	]
+
+
+async def create_video(vhs_tape: VHSTape, semaphore: asyncio.Semaphore) -> None:
+	"Create the video for the given VHS tape"
+
+	# Limit the number of vhs processes running at once
+	async with semaphore:
+		#
+
+		# Create the vhs process for the VHS tape
+		process = await asyncio.create_subprocess_exec(
+			"vhs", vhs_tape.get_file_path()
+		)
+
+		# Wait for the vhs process to complete,
+		# terminating it when the task is cancelled,
+		# as vhs records in real time
+		# and would otherwise keep running
+		try:
+			await process.wait()
+		except asyncio.CancelledError:
+			if process.returncode is None:
+				process.terminate()
+				await process.wait()
+			raise
+
+		# If the vhs process failed,
+		# raise an error to cancel the other vhs processes
+		if process.returncode != 0:
+			raise subprocess.CalledProcessError(
+				cast(int, process.returncode),
+				["vhs", vhs_tape.get_file_path()],
+			)
+
+		# Cache the hash of the VHS tape
+		# so unchanged tapes can be skipped on the next run
+		vhs_tape.get_hash_file_path().write_text(vhs_tape.get_content_hash())
+
+
+async def main():
+	"Main function to run to generate the VHS tapes"
+
+	# Get the arguments to the script
+	args = get_command_line_arguments()
+
+	# Get the path to the darkman binary
+	darkman_binary = shutil.which("darkman")
+
+	# Initialise whether the theme is light
+	is_light_theme = False
+
+	# If darkman is available
+	if darkman_binary is not None:
+		#
+
+		# The path to darkman's theme state file
+		darkman_theme_file = Path.home() / ".local/share/darkman/theme"
+
+		# If the theme state file exists,
+		# read the current theme from it
+		# to skip the darkman subprocess
+		if darkman_theme_file.is_file():
+			initial_theme = darkman_theme_file.read_text().strip()
+
+		# Otherwise, get the current theme from darkman
+		else:
+			darkman_result = subprocess.run(
+				[darkman_binary, "get"], capture_output=True
+			)
+			initial_theme = darkman_result.stdout.decode("utf-8").strip()
+
+		# Get if the theme is light
+		is_light_theme = initial_theme == "light"
+
+		# If the theme is light, change the theme to dark
+		if is_light_theme:
+			subprocess.run([darkman_binary, "set", "dark"])
+
+	# Remove any demonstration directory left over from a failed run
+	if os.path.isdir(DEMONSTRATION_DIRECTORY):
+		shutil.rmtree(DEMONSTRATION_DIRECTORY)
+
+	# Create the demonstration directory
+	os.mkdir(DEMONSTRATION_DIRECTORY)
+
+	# Change directory to the demonstration directory
+	os.chdir(DEMONSTRATION_DIRECTORY)
+
+	try:
+		#
+
+		# Create the VHS tapes directory if it doesn't exist
+		VHS_TAPES_DIRECTORY.mkdir(exist_ok=True)
+
+		# Create the files and folders for the demonstration
+		for folder in [EMPTY_FOLDER, PROTECTED_FOLDER, "."] + [
+			f"folder-{number}" for number in range(1, 4)
+		]:
+			#
+
+			# If the folder is the VHS tapes directory, or the empty folder
+			if folder in [VHS_TAPES_DIRECTORY, EMPTY_FOLDER]:
+				#
+
+				# Create the folder
+				os.mkdir(folder)
+
+				# Continue the loop
+				continue
+
+			# Create an inner folder
+			os.makedirs(f"{folder}/inner-folder/")
+
+			# Iterate over the files for the folder
+			for file_number in range(1, 11):
+				#
+
+				# Create the file with the demonstration text
+				with open(f"{folder}/file-{file_number}.txt", "w") as file:
+					file.write(DEMONSTRATION_TEXT)
+
+		# The path to the file in the folder with subdirectory
+		file_in_folder_with_subdirectory = Path(
+			f"./{FOLDER_WITH_SUBDIRECTORY}/subdirectory/hi-there.txt"
+		)
+
+		# Create the folder with the subdirectory
+		file_in_folder_with_subdirectory.parent.mkdir(parents=True)
+
+		# Write to the file in the folder with subdirectory
+		file_in_folder_with_subdirectory.write_text("Skipped!")
+
+		# Create the list of vhs tapes
+		vhs_tapes = create_vhs_tapes()
+
+		# If a search term is given,
+		# then get only the vhs tapes
+		# that contain the search terms
+		if (search_term := cast(str | None, args.search_term)) is not None:
+			#
+
+			# Split the search term into lowercase terms once
+			search_terms = search_term.lower().split()
+
+			# Keep only the VHS tapes whose name contains all the terms
+			vhs_tapes = [
+				vhs_tape
+				for vhs_tape in vhs_tapes
+				if all(term in vhs_tape._name_lower for term in search_terms)
+			]
+
+		# Create the VHS cache directory if it doesn't exist
+		VHS_CACHE_DIRECTORY.mkdir(exist_ok=True)
+
+		# Skip the VHS tapes that are unchanged since the last run,
+		# as their videos already exist
+		vhs_tapes = [
+			vhs_tape for vhs_tape in vhs_tapes if not vhs_tape.is_unchanged()
+		]
+
+		# Get the running event loop
+		loop = asyncio.get_running_loop()
+
+		# Write the VHS tapes to their tape files
+		# using a single bounded thread pool
+		with ThreadPoolExecutor(
+			max_workers=min(32, (os.cpu_count() or 4) * 4)
+		) as executor:
+			await asyncio.gather(
+				*(
+					loop.run_in_executor(executor, vhs_tape.write_to_file)
+					for vhs_tape in vhs_tapes
+				)
+			)
+
+		# The semaphore to limit the number of vhs processes to one,
+		# as the recorded demos mutate shared state,
+		# like the plugin's config.lua, the keymap.toml file
+		# and the fixtures in the demonstration directory,
+		# so concurrent recordings capture each other's artifacts
+		semaphore = asyncio.Semaphore(1)
+
+		# Create the videos for the VHS tapes,
+		# cancelling the remaining vhs processes
+		# when one of them fails
+		async with asyncio.TaskGroup() as task_group:
+			for vhs_tape in vhs_tapes:
+				task_group.create_task(create_video(vhs_tape, semaphore))
+
+	# Always clean up, even when a render fails midway
+	finally:
+		#
 
-	# Remove the demonstration directory
-	shutil.rmtree(DEMONSTRATION_DIRECTORY)
+		# Remove the demonstration directory
+		shutil.rmtree(DEMONSTRATION_DIRECTORY)
 
-	# Set the theme back to light if the theme was initially light
-	if is_light_theme:
-		subprocess.run(["darkman", "set", "light"])
+		# Set the theme back to light if the theme was initially light
+		if darkman_binary is not None and is_light_theme:
+			subprocess.run([darkman_binary, "set", "light"])
 
 
 # Name safeguard